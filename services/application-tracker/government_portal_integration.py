@@ -53,18 +53,62 @@ class ApplicationStatus(str, Enum):
     COMPLETED = "completed"
 
 
+# Status lookup tables, built once at import
+_STATUS_DESCRIPTIONS = {
+    ApplicationStatus.DRAFT: "Application is being prepared",
+    ApplicationStatus.SUBMITTED: "Application has been submitted successfully",
+    ApplicationStatus.UNDER_REVIEW: "Application is under review by officials",
+    ApplicationStatus.PENDING_DOCUMENTS: "Additional documents are required",
+    ApplicationStatus.APPROVED: "Application has been approved",
+    ApplicationStatus.REJECTED: "Application has been rejected",
+    ApplicationStatus.PROCESSING: "Application is being processed",
+    ApplicationStatus.COMPLETED: "Application processing is complete"
+}
+
+_STATUS_NEXT_STEPS = {
+    ApplicationStatus.SUBMITTED: (
+        "Wait for initial review (3-5 business days)",
+        "Check status regularly for updates"
+    ),
+    ApplicationStatus.UNDER_REVIEW: (
+        "Officials are reviewing your application",
+        "You may be contacted for additional information"
+    ),
+    ApplicationStatus.PENDING_DOCUMENTS: (
+        "Submit the required documents",
+        "Check the document requirements section"
+    ),
+    ApplicationStatus.PROCESSING: (
+        "Application is being processed",
+        "Expected completion in 10-15 days"
+    ),
+    ApplicationStatus.APPROVED: (
+        "Your application has been approved",
+        "Benefits will be disbursed as per scheme guidelines"
+    )
+}
+
+_DEFAULT_NEXT_STEPS = ("Check back later for updates",)
+
+
 class GovernmentPortalIntegration:
     """
     Manages secure connections to government portals and handles
     application submission and status tracking.
     """
 
-    def __init__(self, encryption_key: Optional[bytes] = None):
+    def __init__(
+        self,
+        encryption_key: Optional[bytes] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the government portal integration service.
         
         Args:
             encryption_key: Optional encryption key for secure data storage
+            http_client: Optional shared HTTP client; when omitted the service
+                creates and owns its own client
         """
         # Generate or use provided encryption key
         self.encryption_key = encryption_key or Fernet.generate_key()
@@ -73,8 +117,9 @@ class GovernmentPortalIntegration:
         # Portal configurations (in production, these would come from secure config)
         self.portal_configs = self._initialize_portal_configs()
         
-        # HTTP client for API calls
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # HTTP client for API calls (closed on shutdown only if we created it)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
         
         # Token cache for authenticated sessions
         self.token_cache: Dict[str, Dict[str, Any]] = {}
@@ -84,12 +129,13 @@ class GovernmentPortalIntegration:
         
         # Initialize secure authentication components
         self.credential_vault = CredentialVault()
-        self.audit_logger = AuditLogger()
+        # Audit writes run on a writer thread so they never block the event loop
+        self.audit_logger = AuditLogger(background=True)
         self.session_manager = SessionManager(
             session_timeout_minutes=30,
             max_idle_minutes=15
         )
-        self.oauth2_manager = OAuth2TokenManager()
+        self.oauth2_manager = OAuth2TokenManager(http_client=self.http_client)
 
     def _initialize_portal_configs(self) -> Dict[PortalType, Dict[str, Any]]:
         """
@@ -349,7 +395,7 @@ class GovernmentPortalIntegration:
             if result['success']:
                 return {
                     "token": result['access_token'],
-                    "expires_at": datetime.fromisoformat(result['expires_at']),
+                    "expires_at": oauth_client.token_expires_at,
                     "token_type": "Bearer",
                     "refresh_token": result.get('refresh_token')
                 }
@@ -658,43 +704,11 @@ class GovernmentPortalIntegration:
 
     def _get_status_description(self, status: ApplicationStatus) -> str:
         """Get human-readable status description"""
-        descriptions = {
-            ApplicationStatus.DRAFT: "Application is being prepared",
-            ApplicationStatus.SUBMITTED: "Application has been submitted successfully",
-            ApplicationStatus.UNDER_REVIEW: "Application is under review by officials",
-            ApplicationStatus.PENDING_DOCUMENTS: "Additional documents are required",
-            ApplicationStatus.APPROVED: "Application has been approved",
-            ApplicationStatus.REJECTED: "Application has been rejected",
-            ApplicationStatus.PROCESSING: "Application is being processed",
-            ApplicationStatus.COMPLETED: "Application processing is complete"
-        }
-        return descriptions.get(status, "Status unknown")
+        return _STATUS_DESCRIPTIONS.get(status, "Status unknown")
 
     def _get_next_steps(self, status: ApplicationStatus) -> List[str]:
         """Get next steps based on current status"""
-        next_steps = {
-            ApplicationStatus.SUBMITTED: [
-                "Wait for initial review (3-5 business days)",
-                "Check status regularly for updates"
-            ],
-            ApplicationStatus.UNDER_REVIEW: [
-                "Officials are reviewing your application",
-                "You may be contacted for additional information"
-            ],
-            ApplicationStatus.PENDING_DOCUMENTS: [
-                "Submit the required documents",
-                "Check the document requirements section"
-            ],
-            ApplicationStatus.PROCESSING: [
-                "Application is being processed",
-                "Expected completion in 10-15 days"
-            ],
-            ApplicationStatus.APPROVED: [
-                "Your application has been approved",
-                "Benefits will be disbursed as per scheme guidelines"
-            ]
-        }
-        return next_steps.get(status, ["Check back later for updates"])
+        return list(_STATUS_NEXT_STEPS.get(status, _DEFAULT_NEXT_STEPS))
 
     async def monitor_application_status(
         self,
@@ -747,8 +761,10 @@ class GovernmentPortalIntegration:
 
     async def close(self):
         """Close HTTP client and cleanup resources"""
-        await self.http_client.aclose()
+        if self._owns_http_client:
+            await self.http_client.aclose()
         await self.oauth2_manager.close_all()
+        self.audit_logger.close()
     
     def validate_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
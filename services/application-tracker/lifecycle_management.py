@@ -6,21 +6,133 @@ timeline management, notifications, and additional information requests.
 Validates: Requirements 6.2, 6.4
 """
 
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Set
 from enum import Enum
-from pydantic import BaseModel, Field
 import asyncio
+import uuid
 from outcome_explanation import (
     OutcomeExplanationSystem,
     OutcomeType,
     RejectionReason,
     OutcomeExplanation,
     AppealGuidance,
-    ResubmissionGuidance
+    ResubmissionGuidance,
+    _format_date
 )
 
 
+# Notification and request ids only need to be unique, not unpredictable:
+# a random per-process prefix plus a counter avoids an os.urandom call per id
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_id_counter = count(1)
+
+
+def _next_id() -> str:
+    """Generate a process-unique identifier"""
+    return f"{_ID_PREFIX}-{next(_id_counter)}"
+
+
+# Keywords used to infer a rejection reason from its explanation text,
+# checked in order so earlier entries take precedence
+_REJECTION_REASON_KEYWORDS = (
+    ("incomplete", RejectionReason.INCOMPLETE_DOCUMENTS),
+    ("missing", RejectionReason.INCOMPLETE_DOCUMENTS),
+    ("ineligible", RejectionReason.INELIGIBLE),
+    ("eligibility", RejectionReason.INELIGIBLE),
+    ("duplicate", RejectionReason.DUPLICATE_APPLICATION),
+    ("invalid", RejectionReason.INVALID_INFORMATION),
+    ("incorrect", RejectionReason.INVALID_INFORMATION),
+    ("criteria", RejectionReason.MISSING_CRITERIA),
+    ("expired", RejectionReason.EXPIRED_DOCUMENTS),
+    ("technical", RejectionReason.TECHNICAL_ERROR)
+)
+
+# Typical government processing stages as (stage, title, description, ratio),
+# where ratio is the fraction of the total processing time at which the
+# stage is expected to be reached
+_MILESTONE_TEMPLATE = (
+    ("submission", "Application Submitted", "Your application has been received", 0.0),
+    ("acknowledgment", "Acknowledgment", "Application acknowledged by department", 0.1),
+    ("verification", "Document Verification", "Documents are being verified", 0.3),
+    ("review", "Under Review", "Application is under review by officials", 0.6),
+    ("approval", "Approval Process", "Application is in final approval stage", 0.9),
+    ("completion", "Completed", "Application processing completed", 1.0)
+)
+
+# Base processing times by portal (in days)
+_BASE_PROCESSING_DAYS: Dict[str, int] = {
+    "myscheme": 21,
+    "eshram": 7,
+    "umang": 14,
+    "pmkisan": 30,
+    "mgnrega": 15,
+    "ayushmanbharat": 45,
+    "digilocker": 1,
+    "generic": 21
+}
+
+# Adjustments (in days) applied when the scheme type contains the keyword
+_SCHEME_ADJUSTMENTS = (
+    ("pension", 15),  # Additional days for pension schemes
+    ("subsidy", 10),
+    ("loan", 20),
+    ("certificate", -7),  # Faster for certificates
+    ("registration", -5)
+)
+
+
+@lru_cache(maxsize=256)
+def _calculate_processing_time(portal_type: str, scheme_type: Optional[str] = None) -> int:
+    """Estimated processing time in days for a portal/scheme combination"""
+    base_time = _BASE_PROCESSING_DAYS.get(portal_type, 21)
+    
+    # Adjust based on scheme type if provided
+    if scheme_type:
+        scheme_type = scheme_type.lower()
+        for key, adjustment in _SCHEME_ADJUSTMENTS:
+            if key in scheme_type:
+                base_time += adjustment
+                break
+    
+    return max(base_time, 1)  # Minimum 1 day
+
+
+class _LRUDict(OrderedDict):
+    """
+    Mapping that keeps at most ``maxsize`` entries, evicting the least
+    recently used one. ``on_evict(key, value)`` is called for each eviction.
+    Evicted entries are discarded; nothing reloads them.
+    """
+
+    def __init__(self, maxsize: int, on_evict: Optional[Callable[[Any, Any], None]] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            evicted_key, evicted_value = self.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(evicted_key, evicted_value)
+
+
 class NotificationType(str, Enum):
     """Types of notifications"""
     STATUS_UPDATE = "status_update"
@@ -39,18 +151,92 @@ class NotificationPriority(str, Enum):
     URGENT = "urgent"
 
 
-class ApplicationTimeline(BaseModel):
-    """Timeline information for an application"""
+@dataclass(frozen=True, slots=True)
+class TimelineHeader:
+    """Submission details of a timeline, fixed once the application is submitted"""
     confirmation_number: str
     application_id: str
     submitted_at: datetime
+
+
+@dataclass(slots=True)
+class TimelineProgress:
+    """Progress details of a timeline, updated as the application moves forward"""
     expected_completion: datetime
     estimated_days: int
-    milestones: List[Dict[str, Any]] = Field(default_factory=list)
     last_updated: datetime
+    milestones: List[Dict[str, Any]] = field(default_factory=list)
+    milestones_by_stage: Dict[str, Dict[str, Any]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Index the same milestone dicts by stage for constant-time updates
+        self.milestones_by_stage = {milestone["stage"]: milestone for milestone in self.milestones}
+
+
+# Notification priority by application status (MEDIUM otherwise)
+_STATUS_PRIORITY: Dict[str, NotificationPriority] = {
+    "approved": NotificationPriority.HIGH,
+    "rejected": NotificationPriority.HIGH,
+    "pending_documents": NotificationPriority.URGENT
+}
+
+# Notification type, priority and title by application outcome
+_OUTCOME_NOTIFICATIONS = {
+    OutcomeType.APPROVED: (
+        NotificationType.APPROVAL, NotificationPriority.HIGH, "Application Approved!"
+    ),
+    OutcomeType.REJECTED: (
+        NotificationType.REJECTION, NotificationPriority.HIGH, "Application Decision"
+    ),
+    OutcomeType.PARTIALLY_APPROVED: (
+        NotificationType.STATUS_UPDATE, NotificationPriority.HIGH, "Application Partially Approved"
+    )
+}
+
+
+@dataclass(slots=True)
+class ApplicationTimeline:
+    """
+    Timeline information for an application.
+    
+    Reads go straight to the immutable header or the mutable progress record;
+    updates only ever touch the progress record, so the header can be shared
+    freely (e.g. in audit snapshots) without copying.
+    """
+    header: TimelineHeader
+    progress: TimelineProgress
+
+    @property
+    def confirmation_number(self) -> str:
+        return self.header.confirmation_number
 
+    @property
+    def application_id(self) -> str:
+        return self.header.application_id
 
-class Notification(BaseModel):
+    @property
+    def submitted_at(self) -> datetime:
+        return self.header.submitted_at
+
+    @property
+    def expected_completion(self) -> datetime:
+        return self.progress.expected_completion
+
+    @property
+    def estimated_days(self) -> int:
+        return self.progress.estimated_days
+
+    @property
+    def last_updated(self) -> datetime:
+        return self.progress.last_updated
+
+    @property
+    def milestones(self) -> List[Dict[str, Any]]:
+        return self.progress.milestones
+
+
+@dataclass(slots=True)
+class Notification:
     """Notification model"""
     notification_id: str
     application_id: str
@@ -64,7 +250,8 @@ class Notification(BaseModel):
     action_details: Optional[Dict[str, Any]] = None
 
 
-class AdditionalInfoRequest(BaseModel):
+@dataclass(slots=True)
+class AdditionalInfoRequest:
     """Request for additional information"""
     request_id: str
     application_id: str
@@ -81,21 +268,65 @@ class LifecycleManager:
     and additional information requests.
     """
 
-    def __init__(self):
-        """Initialize the lifecycle manager"""
+    def __init__(
+        self,
+        max_notifications_per_application: int = 500,
+        max_applications: int = 100_000
+    ):
+        """
+        Initialize the lifecycle manager.
+        
+        Args:
+            max_notifications_per_application: Number of notifications kept
+                per application; the oldest are dropped beyond this
+            max_applications: Number of applications kept in each in-memory
+                store, and in the subscriber registry; the least recently
+                used are evicted beyond this. Nothing reloads an evicted
+                application, so lookups for it behave as for an unknown one
+        """
+        self.max_notifications_per_application = max_notifications_per_application
+        self.max_applications = max_applications
+        
         # Storage for timelines, notifications, and requests
-        self.timelines: Dict[str, ApplicationTimeline] = {}
-        self.notifications: Dict[str, List[Notification]] = {}
-        self.info_requests: Dict[str, List[AdditionalInfoRequest]] = {}
+        self.timelines: Dict[str, ApplicationTimeline] = _LRUDict(max_applications)
+        self.notifications: Dict[str, deque] = _LRUDict(
+            max_applications,
+            on_evict=lambda application_id, _: self._unread_counts.pop(application_id, None)
+        )
+        self._unread_counts: Dict[str, int] = {}
+        self.info_requests: Dict[str, List[AdditionalInfoRequest]] = _LRUDict(
+            max_applications,
+            on_evict=self._evict_info_requests
+        )
+        self._info_request_index: Dict[str, AdditionalInfoRequest] = {}
         
         # Notification subscribers (in production, this would be a message queue)
-        self.notification_subscribers: Dict[str, List[callable]] = {}
+        # Stored as insertion-ordered dicts so subscribing is idempotent and
+        # unsubscribing is O(1)
+        self.notification_subscribers: Dict[str, Dict[callable, None]] = _LRUDict(max_applications)
+        
+        # Notifications awaiting delivery to subscribers, per application;
+        # an entry exists only while a delivery is in progress
+        self._pending_delivery: Dict[str, deque] = {}
+        
+        # Drains handed to background tasks after the sender running them
+        # was cancelled; referenced here until they finish
+        self._drain_tasks: Set[asyncio.Task] = set()
         
         # Outcome explanation system
         self.outcome_system = OutcomeExplanationSystem()
         
         # Storage for outcome explanations
-        self.outcome_explanations: Dict[str, OutcomeExplanation] = {}
+        self.outcome_explanations: Dict[str, OutcomeExplanation] = _LRUDict(max_applications)
+
+    def _evict_info_requests(
+        self,
+        application_id: str,
+        requests: List[AdditionalInfoRequest]
+    ):
+        """Drop index entries for requests of an evicted application"""
+        for request in requests:
+            self._info_request_index.pop(request.request_id, None)
 
     async def create_timeline(
         self,
@@ -132,13 +363,17 @@ class LifecycleManager:
         )
         
         timeline = ApplicationTimeline(
-            confirmation_number=confirmation_number,
-            application_id=application_id,
-            submitted_at=submitted_at,
-            expected_completion=expected_completion,
-            estimated_days=estimated_days,
-            milestones=milestones,
-            last_updated=submitted_at
+            header=TimelineHeader(
+                confirmation_number=confirmation_number,
+                application_id=application_id,
+                submitted_at=submitted_at
+            ),
+            progress=TimelineProgress(
+                expected_completion=expected_completion,
+                estimated_days=estimated_days,
+                last_updated=submitted_at,
+                milestones=milestones
+            )
         )
         
         # Store timeline
@@ -151,7 +386,7 @@ class LifecycleManager:
             priority=NotificationPriority.MEDIUM,
             title="Application Submitted Successfully",
             message=f"Your application has been submitted. Confirmation number: {confirmation_number}. "
-                   f"Expected completion: {expected_completion.strftime('%d %B %Y')} "
+                   f"Expected completion: {_format_date(expected_completion)} "
                    f"(approximately {estimated_days} days).",
             action_required=False
         )
@@ -169,36 +404,7 @@ class LifecycleManager:
         Returns:
             Estimated processing time in days
         """
-        # Base processing times by portal (in days)
-        base_times = {
-            "myscheme": 21,
-            "eshram": 7,
-            "umang": 14,
-            "pmkisan": 30,
-            "mgnrega": 15,
-            "ayushmanbharat": 45,
-            "digilocker": 1,
-            "generic": 21
-        }
-        
-        base_time = base_times.get(portal_type, 21)
-        
-        # Adjust based on scheme type if provided
-        if scheme_type:
-            scheme_adjustments = {
-                "pension": 15,  # Additional days for pension schemes
-                "subsidy": 10,
-                "loan": 20,
-                "certificate": -7,  # Faster for certificates
-                "registration": -5
-            }
-            
-            for key, adjustment in scheme_adjustments.items():
-                if key in scheme_type.lower():
-                    base_time += adjustment
-                    break
-        
-        return max(base_time, 1)  # Minimum 1 day
+        return _calculate_processing_time(portal_type, scheme_type)
 
     def _generate_milestones(
         self,
@@ -213,52 +419,33 @@ class LifecycleManager:
             List of milestone dictionaries with dates and descriptions
         """
         total_days = (expected_completion - submitted_at).days
-        
-        milestones = [
-            {
-                "stage": "submission",
-                "title": "Application Submitted",
-                "description": "Your application has been received",
-                "expected_date": submitted_at.isoformat(),
-                "completed": True,
-                "completed_at": submitted_at.isoformat()
-            },
-            {
-                "stage": "acknowledgment",
-                "title": "Acknowledgment",
-                "description": "Application acknowledged by department",
-                "expected_date": (submitted_at + timedelta(days=int(total_days * 0.1))).isoformat(),
-                "completed": False
-            },
-            {
-                "stage": "verification",
-                "title": "Document Verification",
-                "description": "Documents are being verified",
-                "expected_date": (submitted_at + timedelta(days=int(total_days * 0.3))).isoformat(),
-                "completed": False
-            },
-            {
-                "stage": "review",
-                "title": "Under Review",
-                "description": "Application is under review by officials",
-                "expected_date": (submitted_at + timedelta(days=int(total_days * 0.6))).isoformat(),
-                "completed": False
-            },
-            {
-                "stage": "approval",
-                "title": "Approval Process",
-                "description": "Application is in final approval stage",
-                "expected_date": (submitted_at + timedelta(days=int(total_days * 0.9))).isoformat(),
-                "completed": False
-            },
-            {
-                "stage": "completion",
-                "title": "Completed",
-                "description": "Application processing completed",
-                "expected_date": expected_completion.isoformat(),
+        submitted_iso = submitted_at.isoformat()
+        
+        milestones = []
+        for stage, title, description, ratio in _MILESTONE_TEMPLATE:
+            if ratio == 0.0:
+                milestones.append({
+                    "stage": stage,
+                    "title": title,
+                    "description": description,
+                    "expected_date": submitted_iso,
+                    "completed": True,
+                    "completed_at": submitted_iso
+                })
+                continue
+            
+            if ratio == 1.0:
+                expected_date = expected_completion.isoformat()
+            else:
+                expected_date = (submitted_at + timedelta(days=int(total_days * ratio))).isoformat()
+            
+            milestones.append({
+                "stage": stage,
+                "title": title,
+                "description": description,
+                "expected_date": expected_date,
                 "completed": False
-            }
-        ]
+            })
         
         return milestones
 
@@ -295,17 +482,21 @@ class LifecycleManager:
         if not timeline:
             raise ValueError(f"Timeline not found for application {application_id}")
         
-        # Update milestones
-        for milestone in timeline.milestones:
-            if milestone["stage"] == current_stage and not milestone["completed"]:
-                milestone["completed"] = True
-                milestone["completed_at"] = datetime.now().isoformat()
+        now = datetime.now()
+        
+        progress = timeline.progress
+        
+        # Update milestone
+        milestone = progress.milestones_by_stage.get(current_stage)
+        if milestone is not None and not milestone["completed"]:
+            milestone["completed"] = True
+            milestone["completed_at"] = now.isoformat()
         
         # Update expected completion if provided
         if new_expected_completion:
-            old_date = timeline.expected_completion
-            timeline.expected_completion = new_expected_completion
-            timeline.estimated_days = (new_expected_completion - timeline.submitted_at).days
+            old_date = progress.expected_completion
+            progress.expected_completion = new_expected_completion
+            progress.estimated_days = (new_expected_completion - timeline.submitted_at).days
             
             # Notify about timeline change
             await self._send_notification(
@@ -313,13 +504,12 @@ class LifecycleManager:
                 notification_type=NotificationType.TIMELINE_UPDATE,
                 priority=NotificationPriority.MEDIUM,
                 title="Timeline Updated",
-                message=f"Expected completion date updated from {old_date.strftime('%d %B %Y')} "
-                       f"to {new_expected_completion.strftime('%d %B %Y')}.",
+                message=f"Expected completion date updated from {_format_date(old_date)} "
+                       f"to {_format_date(new_expected_completion)}.",
                 action_required=False
             )
         
-        timeline.last_updated = datetime.now()
-        self.timelines[application_id] = timeline
+        progress.last_updated = now
         
         return timeline
 
@@ -345,16 +535,14 @@ class LifecycleManager:
         Validates: Requirement 6.2 (status update notifications)
         """
         # Determine priority based on status
-        priority = NotificationPriority.MEDIUM
-        if status in ["approved", "rejected"]:
-            priority = NotificationPriority.HIGH
-        elif status == "pending_documents":
-            priority = NotificationPriority.URGENT
-        
-        # Format next steps
-        next_steps_text = "\n".join([f"• {step}" for step in next_steps])
+        priority = _STATUS_PRIORITY.get(status, NotificationPriority.MEDIUM)
         
-        message = f"{status_description}\n\nNext Steps:\n{next_steps_text}"
+        # Format message with next steps
+        message = "".join((
+            status_description,
+            "\n\nNext Steps:\n",
+            "\n".join([f"• {step}" for step in next_steps])
+        ))
         
         return await self._send_notification(
             application_id=application_id,
@@ -384,9 +572,7 @@ class LifecycleManager:
             
         Validates: Requirement 6.4 (notify users and guide next steps)
         """
-        import uuid
-        
-        request_id = str(uuid.uuid4())
+        request_id = _next_id()
         requested_at = datetime.now()
         due_date = requested_at + timedelta(days=due_days)
         
@@ -400,9 +586,8 @@ class LifecycleManager:
         )
         
         # Store request
-        if application_id not in self.info_requests:
-            self.info_requests[application_id] = []
-        self.info_requests[application_id].append(request)
+        self.info_requests.setdefault(application_id, []).append(request)
+        self._info_request_index[request_id] = request
         
         # Format items for notification
         items_text = "\n".join([
@@ -417,7 +602,7 @@ class LifecycleManager:
             priority=NotificationPriority.URGENT,
             title="Additional Information Required",
             message=f"Your application requires additional information. "
-                   f"Please provide the following by {due_date.strftime('%d %B %Y')}:\n\n"
+                   f"Please provide the following by {_format_date(due_date)}:\n\n"
                    f"{items_text}\n\n"
                    f"Failure to provide this information may result in application rejection.",
             action_required=True,
@@ -471,10 +656,9 @@ class LifecycleManager:
             
         Validates: Requirement 6.4 (handle additional information requests)
         """
-        requests = self.info_requests.get(application_id, [])
-        request = next((r for r in requests if r.request_id == request_id), None)
+        request = self._info_request_index.get(request_id)
         
-        if not request:
+        if request is None or request.application_id != application_id:
             raise ValueError(f"Request {request_id} not found for application {application_id}")
         
         if request.status != "pending":
@@ -512,12 +696,14 @@ class LifecycleManager:
         Returns:
             List of Notification objects
         """
-        notifications = self.notifications.get(application_id, [])
+        notifications = self.notifications.get(application_id, ())
         
         if unread_only:
-            notifications = [n for n in notifications if not n.read]
+            if not self._unread_counts.get(application_id):
+                return []
+            return [n for n in notifications if not n.read]
         
-        return notifications
+        return list(notifications)
 
     async def mark_notification_read(
         self,
@@ -538,7 +724,9 @@ class LifecycleManager:
         
         for notification in notifications:
             if notification.notification_id == notification_id:
-                notification.read = True
+                if not notification.read:
+                    notification.read = True
+                    self._unread_counts[application_id] -= 1
                 return True
         
         return False
@@ -559,10 +747,8 @@ class LifecycleManager:
         Returns:
             Created Notification
         """
-        import uuid
-        
         notification = Notification(
-            notification_id=str(uuid.uuid4()),
+            notification_id=_next_id(),
             application_id=application_id,
             notification_type=notification_type,
             priority=priority,
@@ -575,15 +761,57 @@ class LifecycleManager:
         )
         
         # Store notification
-        if application_id not in self.notifications:
-            self.notifications[application_id] = []
-        self.notifications[application_id].append(notification)
-        
-        # Notify subscribers (in production, this would publish to message queue)
-        await self._notify_subscribers(application_id, notification)
+        stored = self.notifications.get(application_id)
+        if stored is None:
+            stored = deque(maxlen=self.max_notifications_per_application)
+            self.notifications[application_id] = stored
+            self._unread_counts[application_id] = 0
+        if len(stored) == stored.maxlen and not stored[0].read:
+            # The oldest notification is about to be dropped unread
+            self._unread_counts[application_id] -= 1
+        stored.append(notification)
+        self._unread_counts[application_id] += 1
+        
+        # Notify subscribers (in production, this would publish to message queue).
+        # Only the call that makes the queue non-empty drains it; notifications
+        # sent while a drain is in progress are picked up by that drain.
+        if self.notification_subscribers.get(application_id):
+            pending = self._pending_delivery.setdefault(application_id, deque())
+            pending.append(notification)
+            if len(pending) == 1:
+                await self._drain_notifications(application_id, pending)
         
         return notification
 
+    async def _drain_notifications(self, application_id: str, pending: deque):
+        """Deliver queued notifications for an application in order"""
+        try:
+            while pending:
+                # Keep the head queued while delivering so concurrent senders
+                # see a non-empty queue and do not start a second drain
+                await self._notify_subscribers(application_id, pending[0])
+                pending.popleft()
+            self._release_pending(application_id, pending)
+        except BaseException:
+            # The interrupted notification may already have reached some
+            # subscribers, so it is not redelivered. Later senders only
+            # appended to the queue, so the rest continue in the background
+            pending.popleft()
+            if pending:
+                task = asyncio.get_running_loop().create_task(
+                    self._drain_notifications(application_id, pending)
+                )
+                self._drain_tasks.add(task)
+                task.add_done_callback(self._drain_tasks.discard)
+            else:
+                self._release_pending(application_id, pending)
+            raise
+
+    def _release_pending(self, application_id: str, pending: deque):
+        """Drop an application's drained delivery queue"""
+        if self._pending_delivery.get(application_id) is pending:
+            del self._pending_delivery[application_id]
+
     async def _notify_subscribers(
         self,
         application_id: str,
@@ -593,17 +821,27 @@ class LifecycleManager:
         Notify subscribers about new notification.
         In production, this would publish to a message queue or webhook.
         """
-        subscribers = self.notification_subscribers.get(application_id, [])
+        # Snapshot so callbacks may (un)subscribe during delivery
+        subscribers = tuple(self.notification_subscribers.get(application_id, ()))
         
+        # Sync subscribers run inline; async ones are awaited concurrently so
+        # one slow subscriber does not delay the rest
+        pending = []
         for subscriber in subscribers:
             try:
                 if asyncio.iscoroutinefunction(subscriber):
-                    await subscriber(notification)
+                    pending.append(subscriber(notification))
                 else:
                     subscriber(notification)
             except Exception as e:
                 # Log error but don't fail notification creation
                 print(f"Error notifying subscriber: {e}")
+        
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error notifying subscriber: {result}")
 
     def subscribe_to_notifications(
         self,
@@ -617,10 +855,7 @@ class LifecycleManager:
             application_id: Application identifier
             callback: Callback function to receive notifications
         """
-        if application_id not in self.notification_subscribers:
-            self.notification_subscribers[application_id] = []
-        
-        self.notification_subscribers[application_id].append(callback)
+        self.notification_subscribers.setdefault(application_id, {})[callback] = None
 
     def unsubscribe_from_notifications(
         self,
@@ -634,11 +869,11 @@ class LifecycleManager:
             application_id: Application identifier
             callback: Callback function to remove
         """
-        if application_id in self.notification_subscribers:
-            try:
-                self.notification_subscribers[application_id].remove(callback)
-            except ValueError:
-                pass
+        subscribers = self.notification_subscribers.get(application_id)
+        if subscribers is not None:
+            subscribers.pop(callback, None)
+            if not subscribers:
+                del self.notification_subscribers[application_id]
 
     async def send_outcome_notification(
         self,
@@ -679,38 +914,30 @@ class LifecycleManager:
         self.outcome_explanations[application_id] = explanation
         
         # Determine notification type and priority
-        if outcome_type == OutcomeType.APPROVED:
-            notification_type = NotificationType.APPROVAL
-            priority = NotificationPriority.HIGH
-            title = "Application Approved!"
-        elif outcome_type == OutcomeType.REJECTED:
-            notification_type = NotificationType.REJECTION
-            priority = NotificationPriority.HIGH
-            title = "Application Decision"
-        else:
-            notification_type = NotificationType.STATUS_UPDATE
-            priority = NotificationPriority.HIGH
-            title = "Application Partially Approved"
+        notification_type, priority, title = _OUTCOME_NOTIFICATIONS.get(
+            outcome_type,
+            _OUTCOME_NOTIFICATIONS[OutcomeType.PARTIALLY_APPROVED]
+        )
         
         # Format message with explanation
-        message = f"{explanation.primary_reason}\n\n{explanation.detailed_explanation}\n\n"
+        parts = [explanation.primary_reason, "\n\n", explanation.detailed_explanation, "\n\n"]
         
         if explanation.supporting_details:
-            message += "Details:\n"
-            for detail in explanation.supporting_details:
-                message += f"• {detail}\n"
-            message += "\n"
+            parts.append("Details:\n")
+            parts.extend(f"• {detail}\n" for detail in explanation.supporting_details)
+            parts.append("\n")
         
-        message += "Next Steps:\n"
-        for step in explanation.next_steps:
-            message += f"• {step}\n"
+        parts.append("Next Steps:\n")
+        parts.extend(f"• {step}\n" for step in explanation.next_steps)
         
         # Add appeal/resubmission info
         if explanation.appeal_eligible and explanation.appeal_deadline:
-            message += f"\nAppeal Deadline: {explanation.appeal_deadline.strftime('%d %B %Y')}"
+            parts.append(f"\nAppeal Deadline: {_format_date(explanation.appeal_deadline)}")
         
         if explanation.resubmission_allowed:
-            message += "\nResubmission: Allowed with corrections"
+            parts.append("\nResubmission: Allowed with corrections")
+        
+        message = "".join(parts)
         
         # Send notification
         await self._send_notification(
@@ -817,19 +1044,7 @@ class LifecycleManager:
         """
         primary = explanation.primary_reason.lower()
         
-        if "incomplete" in primary or "missing" in primary:
-            return RejectionReason.INCOMPLETE_DOCUMENTS
-        elif "ineligible" in primary or "eligibility" in primary:
-            return RejectionReason.INELIGIBLE
-        elif "duplicate" in primary:
-            return RejectionReason.DUPLICATE_APPLICATION
-        elif "invalid" in primary or "incorrect" in primary:
-            return RejectionReason.INVALID_INFORMATION
-        elif "criteria" in primary:
-            return RejectionReason.MISSING_CRITERIA
-        elif "expired" in primary:
-            return RejectionReason.EXPIRED_DOCUMENTS
-        elif "technical" in primary:
-            return RejectionReason.TECHNICAL_ERROR
-        else:
-            return RejectionReason.OTHER
+        return next(
+            (reason for keyword, reason in _REJECTION_REASON_KEYWORDS if keyword in primary),
+            RejectionReason.OTHER
+        )
@@ -4,9 +4,11 @@ Provides endpoints for government portal integration, application submission,
 and status tracking.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any, List
+from contextlib import asynccontextmanager
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Optional, List
 from government_portal_integration import (
     GovernmentPortalIntegration,
     PortalType,
@@ -23,23 +25,38 @@ from outcome_explanation import (
 )
 import os
 import logging
-import json
-import re
+import time
+import httpx
 from datetime import datetime
+import orjson
 from fastapi.middleware.cors import CORSMiddleware
 
 
 class JSONFormatter(logging.Formatter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ISO prefix for the most recent whole second seen
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record's creation time as UTC ISO-8601 with microseconds"""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int((created - second) * 1_000_000):06d}Z"
+
     def format(self, record):
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "service": "application-tracker",
             "message": record.getMessage(),
         }
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry).decode()
 
 
 handler = logging.StreamHandler()
@@ -48,13 +65,75 @@ logger = logging.getLogger(__name__)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources on shutdown"""
+    yield
+    await portal_integration.close()
+    await http_client.aclose()
+
+
 app = FastAPI(
     title="Application Tracker Service",
     description="Government portal integration, application submission, and status tracking for Gram Sahayak",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-allowed_origins = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
+def _parse_allowed_origins(raw: str) -> List[str]:
+    """
+    Normalize a comma-separated origin list: strip whitespace, drop empty
+    and duplicate entries, and collapse to ["*"] when a wildcard is present
+    so CORSMiddleware takes its allow-all path instead of matching origins.
+    """
+    origins = list(dict.fromkeys(o.strip() for o in raw.split(",") if o.strip()))
+    if "*" in origins:
+        return ["*"]
+    return origins
+
+
+class UnhandledErrorMiddleware:
+    """
+    Log unexpected endpoint errors once and answer with a generic 500.
+    
+    An @app.exception_handler(Exception) would run in ServerErrorMiddleware,
+    outside CORSMiddleware, so its 500s would lack CORS headers, and Starlette
+    re-raises after it, so the server logs the error a second time. This
+    middleware is added before CORSMiddleware, which places it inside.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            if response_started:
+                # Too late to replace the response; let the server close it
+                raise
+            logger.error(f"Error in endpoint {scope['path']}: {exc}", exc_info=exc)
+            response = ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+            await response(scope, receive, send)
+
+
+# Starlette wraps each added middleware around the ones added before it
+app.add_middleware(UnhandledErrorMiddleware)
+
+allowed_origins = _parse_allowed_origins(os.getenv("ALLOWED_ORIGINS", "*"))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -63,17 +142,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# Shared HTTP client so portal calls reuse pooled keep-alive connections
+http_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+)
+
 # Initialize services
-portal_integration = GovernmentPortalIntegration()
+portal_integration = GovernmentPortalIntegration(http_client=http_client)
 lifecycle_manager = LifecycleManager()
 
+# Bound methods used on every submission/status round trip, resolved once
+_submit_application = portal_integration.submit_application
+_get_application_status = portal_integration.get_application_status
+_create_timeline = lifecycle_manager.create_timeline
+_send_status_notification = lifecycle_manager.send_status_notification
+_get_timeline = lifecycle_manager.get_timeline
+_get_notifications = lifecycle_manager.get_notifications
+
+
+_MAX_INPUT_LENGTH = 10000
+
+
+def _strip_html_tags(value: str) -> str:
+    """
+    Remove every ``<...>`` span (at least one character between the brackets).
+    Equivalent to ``re.sub(r'<[^>]+>', '', value)`` but driven by str.find,
+    so it stays linear even on inputs with many unclosed '<'.
+    """
+    parts = []
+    start = 0
+    pos = value.find('<')
+    while pos != -1:
+        end = value.find('>', pos + 1)
+        if end == -1:
+            # No closing bracket anywhere after this point, so no more tags
+            break
+        if end == pos + 1:
+            # "<>" is not a tag; keep scanning after the '<'
+            pos = value.find('<', pos + 1)
+            continue
+        parts.append(value[start:pos])
+        start = end + 1
+        pos = value.find('<', start)
+    if not parts:
+        return value
+    parts.append(value[start:])
+    return ''.join(parts)
+
 
 def sanitize_string(value: str) -> str:
     """Remove HTML tags and limit length for input sanitization."""
     if not value:
         return value
-    clean = re.sub(r'<[^>]+>', '', value)
-    return clean[:10000]
+    if '<' not in value:
+        # Most inputs carry no markup at all
+        return value[:_MAX_INPUT_LENGTH]
+    clean = _strip_html_tags(value)
+    return clean[:_MAX_INPUT_LENGTH]
 
 
 class AuthenticationRequest(BaseModel):
@@ -88,7 +215,7 @@ class AuthenticationRequest(BaseModel):
 class SubmissionRequest(BaseModel):
     """Request model for application submission"""
     portal_type: PortalType
-    application_data: Dict[str, Any] = Field(
+    application_data: dict = Field(
         ...,
         description="Complete application form data"
     )
@@ -125,7 +252,7 @@ class MonitoringRequest(BaseModel):
 class AdditionalInfoRequestModel(BaseModel):
     """Request model for creating additional info request"""
     application_id: str
-    required_items: List[Dict[str, Any]] = Field(
+    required_items: List[dict] = Field(
         ...,
         description="List of required information/documents"
     )
@@ -139,7 +266,7 @@ class AdditionalInfoSubmission(BaseModel):
     """Request model for submitting additional information"""
     request_id: str
     application_id: str
-    submitted_data: Dict[str, Any] = Field(
+    submitted_data: dict = Field(
         ...,
         description="Data being submitted"
     )
@@ -151,6 +278,94 @@ class NotificationMarkRead(BaseModel):
     notification_id: str
 
 
+class TimelineDetails(BaseModel):
+    """Timeline as returned by the API"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    confirmation_number: str
+    application_id: str
+    submitted_at: datetime
+    expected_completion: datetime
+    estimated_days: int
+    milestones: List[dict]
+    last_updated: datetime
+
+
+class TimelineResponse(BaseModel):
+    """Response model for timeline lookup"""
+    success: bool = True
+    timeline: TimelineDetails
+
+
+class NotificationDetails(BaseModel):
+    """Notification as returned by the API"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    notification_id: str
+    type: NotificationType = Field(validation_alias="notification_type")
+    priority: NotificationPriority
+    title: str
+    message: str
+    created_at: datetime
+    read: bool
+    action_required: bool
+    action_details: Optional[dict] = None
+
+
+class NotificationsResponse(BaseModel):
+    """Response model for notification listing"""
+    success: bool = True
+    application_id: str
+    count: int
+    notifications: List[NotificationDetails]
+
+
+class OutcomeDetails(BaseModel):
+    """Outcome explanation as returned by the API"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    type: OutcomeType = Field(validation_alias="outcome_type")
+    date: datetime = Field(validation_alias="outcome_date")
+    primary_reason: str
+    detailed_explanation: str
+    supporting_details: List[str]
+    next_steps: List[str]
+    appeal_eligible: bool
+    appeal_deadline: Optional[datetime] = None
+    resubmission_allowed: bool
+    contact_info: Optional[Dict[str, str]] = None
+
+
+class OutcomeResponse(BaseModel):
+    """Response model for outcome notification and lookup"""
+    success: bool = True
+    application_id: str
+    outcome: OutcomeDetails
+
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize an already-built response model once, in pydantic-core.
+    
+    Routes returning these declare the model under responses= for the
+    OpenAPI schema rather than response_model=, which would dump the model
+    and validate it again.
+    """
+    return Response(
+        model.__pydantic_serializer__.to_json(model),
+        media_type="application/json"
+    )
+
+
+def _timeline_summary(timeline) -> dict:
+    """Timeline fields attached to submission and status responses"""
+    return {
+        "expected_completion": timeline.expected_completion,
+        "estimated_days": timeline.estimated_days,
+        "milestones": timeline.milestones
+    }
+
+
 @app.post("/portal/authenticate")
 async def authenticate_portal(request: AuthenticationRequest):
     """
@@ -158,15 +373,11 @@ async def authenticate_portal(request: AuthenticationRequest):
     
     Validates: Requirement 6.1 (secure API connections)
     """
-    try:
-        result = await portal_integration.authenticate_portal(
-            request.portal_type,
-            request.credentials
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await portal_integration.authenticate_portal(
+        request.portal_type,
+        request.credentials
+    )
+    return result
 
 
 @app.post("/application/submit")
@@ -177,88 +388,70 @@ async def submit_application(request: SubmissionRequest):
     Validates: Requirement 6.1 (application submission automation)
     Validates: Requirement 6.2 (confirmation numbers and expected timelines)
     """
-    try:
-        result = await portal_integration.submit_application(
-            request.portal_type,
-            request.application_data,
-            request.credentials
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=400,
-                detail=result.get("error", "Submission failed")
-            )
-        
-        # Create timeline for the application
-        scheme_type = request.application_data.get("scheme_type")
-        timeline = await lifecycle_manager.create_timeline(
-            confirmation_number=result["confirmation_number"],
-            application_id=result["application_id"],
-            portal_type=request.portal_type.value,
-            scheme_type=scheme_type
+    result = await _submit_application(
+        request.portal_type,
+        request.application_data,
+        request.credentials
+    )
+    
+    if not result.get("success"):
+        raise HTTPException(
+            status_code=400,
+            detail=result.get("error") or "Submission failed"
         )
-        
-        # Add timeline information to response
-        result["timeline"] = {
-            "expected_completion": timeline.expected_completion.isoformat(),
-            "estimated_days": timeline.estimated_days,
-            "milestones": timeline.milestones
-        }
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    # Create timeline for the application
+    scheme_type = request.application_data.get("scheme_type")
+    timeline = await _create_timeline(
+        confirmation_number=result["confirmation_number"],
+        application_id=result["application_id"],
+        portal_type=request.portal_type.value,
+        scheme_type=scheme_type
+    )
+    
+    # Add timeline information to response
+    result["timeline"] = _timeline_summary(timeline)
+    
+    return result
 
 
 @app.post("/application/status")
-async def get_application_status(request: StatusRequest):
+async def get_application_status(request: StatusRequest, background_tasks: BackgroundTasks):
     """
     Retrieve current application status from government portal.
     
     Validates: Requirement 6.3 (status tracking from government systems)
     Validates: Requirement 6.2 (status update notifications)
     """
-    try:
-        result = await portal_integration.get_application_status(
-            request.portal_type,
-            request.application_id,
-            request.credentials
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=400,
-                detail=result.get("error", "Failed to fetch status")
-            )
-        
-        # Send status notification
-        await lifecycle_manager.send_status_notification(
-            application_id=request.application_id,
-            status=result["status"],
-            status_description=result["status_description"],
-            next_steps=result.get("next_steps", [])
+    result = await _get_application_status(
+        request.portal_type,
+        request.application_id,
+        request.credentials
+    )
+    
+    if not result.get("success"):
+        raise HTTPException(
+            status_code=400,
+            detail=result.get("error") or "Failed to fetch status"
         )
-        
-        # Get timeline if available
-        timeline = await lifecycle_manager.get_timeline(request.application_id)
-        if timeline:
-            result["timeline"] = {
-                "confirmation_number": timeline.confirmation_number,
-                "expected_completion": timeline.expected_completion.isoformat(),
-                "estimated_days": timeline.estimated_days,
-                "milestones": timeline.milestones
-            }
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    # Deliver the status notification after the response is sent
+    background_tasks.add_task(
+        _send_status_notification,
+        application_id=request.application_id,
+        status=result["status"],
+        status_description=result["status_description"],
+        next_steps=result.get("next_steps", [])
+    )
+    
+    # Get timeline if available
+    timeline = await _get_timeline(request.application_id)
+    if timeline:
+        summary = _timeline_summary(timeline)
+        summary["confirmation_number"] = timeline.confirmation_number
+        result["timeline"] = summary
+    
+    return result
 
 
 @app.post("/application/monitor")
@@ -268,17 +461,45 @@ async def monitor_application(request: MonitoringRequest):
     
     Validates: Requirement 6.3 (status tracking and monitoring system)
     """
-    try:
-        result = await portal_integration.monitor_application_status(
-            request.portal_type,
-            request.application_id,
-            request.credentials,
-            request.check_interval
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await portal_integration.monitor_application_status(
+        request.portal_type,
+        request.application_id,
+        request.credentials,
+        request.check_interval
+    )
+    return result
+
+
+# Responses for the static listing endpoints only depend on the enums,
+# so they are built once at import time
+SUPPORTED_PORTALS = {
+    "portals": [
+        {
+            "type": portal.value,
+            "name": portal.name,
+            "description": f"{portal.value.upper()} government portal"
+        }
+        for portal in PortalType
+    ]
+}
+
+STATUS_TYPES = {
+    "statuses": [
+        {
+            "value": status.value,
+            "name": status.name,
+            "description": portal_integration._get_status_description(status)
+        }
+        for status in ApplicationStatus
+    ]
+}
+
+# Pre-serialized bodies for the constant endpoints. A fresh Response is
+# built per request because middleware appends headers to the instance.
+_SUPPORTED_PORTALS_BODY = orjson.dumps(SUPPORTED_PORTALS)
+_STATUS_TYPES_BODY = orjson.dumps(STATUS_TYPES)
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "application-tracker"})
+_STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
 
 
 @app.get("/portals/supported")
@@ -286,16 +507,11 @@ async def get_supported_portals():
     """
     Get list of supported government portals.
     """
-    return {
-        "portals": [
-            {
-                "type": portal.value,
-                "name": portal.name,
-                "description": f"{portal.value.upper()} government portal"
-            }
-            for portal in PortalType
-        ]
-    }
+    return Response(
+        _SUPPORTED_PORTALS_BODY,
+        media_type="application/json",
+        headers=_STATIC_CACHE_HEADERS
+    )
 
 
 @app.get("/status/types")
@@ -303,88 +519,50 @@ async def get_status_types():
     """
     Get list of possible application status types.
     """
-    return {
-        "statuses": [
-            {
-                "value": status.value,
-                "name": status.name,
-                "description": portal_integration._get_status_description(status)
-            }
-            for status in ApplicationStatus
-        ]
-    }
+    return Response(
+        _STATUS_TYPES_BODY,
+        media_type="application/json",
+        headers=_STATIC_CACHE_HEADERS
+    )
 
 
-@app.get("/application/{application_id}/timeline")
+@app.get("/application/{application_id}/timeline", responses={200: {"model": TimelineResponse}})
 async def get_timeline(application_id: str):
     """
     Get timeline for an application.
     
     Validates: Requirement 6.2 (confirmation numbers and expected timelines)
     """
-    try:
-        timeline = await lifecycle_manager.get_timeline(sanitize_string(application_id))
-        
-        if not timeline:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Timeline not found for application {application_id}"
-            )
-        
-        return {
-            "success": True,
-            "timeline": {
-                "confirmation_number": timeline.confirmation_number,
-                "application_id": timeline.application_id,
-                "submitted_at": timeline.submitted_at.isoformat(),
-                "expected_completion": timeline.expected_completion.isoformat(),
-                "estimated_days": timeline.estimated_days,
-                "milestones": timeline.milestones,
-                "last_updated": timeline.last_updated.isoformat()
-            }
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    timeline = await _get_timeline(sanitize_string(application_id))
+    
+    if not timeline:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Timeline not found for application {application_id}"
+        )
+    
+    return _model_response(TimelineResponse(timeline=TimelineDetails.model_validate(timeline)))
 
 
-@app.get("/application/{application_id}/notifications")
+@app.get("/application/{application_id}/notifications", responses={200: {"model": NotificationsResponse}})
 async def get_notifications(application_id: str, unread_only: bool = False):
     """
     Get notifications for an application.
     
     Validates: Requirement 6.2 (status update notifications)
     """
-    try:
-        notifications = await lifecycle_manager.get_notifications(
-            application_id,
-            unread_only=unread_only
-        )
-        
-        return {
-            "success": True,
-            "application_id": application_id,
-            "count": len(notifications),
-            "notifications": [
-                {
-                    "notification_id": n.notification_id,
-                    "type": n.notification_type.value,
-                    "priority": n.priority.value,
-                    "title": n.title,
-                    "message": n.message,
-                    "created_at": n.created_at.isoformat(),
-                    "read": n.read,
-                    "action_required": n.action_required,
-                    "action_details": n.action_details
-                }
-                for n in notifications
-            ]
-        }
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    notifications = await _get_notifications(
+        application_id,
+        unread_only=unread_only
+    )
+    
+    # NotificationDetails reads attributes directly, so the Notification
+    # objects are validated in a single pass without per-item dicts
+    return _model_response(NotificationsResponse.model_validate({
+        "application_id": application_id,
+        "count": len(notifications),
+        "notifications": notifications
+    }))
 
 
 @app.post("/application/notification/read")
@@ -392,27 +570,21 @@ async def mark_notification_read(request: NotificationMarkRead):
     """
     Mark a notification as read.
     """
-    try:
-        success = await lifecycle_manager.mark_notification_read(
-            request.application_id,
-            request.notification_id
+    success = await lifecycle_manager.mark_notification_read(
+        request.application_id,
+        request.notification_id
+    )
+    
+    if not success:
+        raise HTTPException(
+            status_code=404,
+            detail="Notification not found"
         )
-        
-        if not success:
-            raise HTTPException(
-                status_code=404,
-                detail="Notification not found"
-            )
-        
-        return {
-            "success": True,
-            "message": "Notification marked as read"
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    return {
+        "success": True,
+        "message": "Notification marked as read"
+    }
 
 
 @app.post("/application/additional-info/request")
@@ -422,27 +594,23 @@ async def create_additional_info_request(request: AdditionalInfoRequestModel):
     
     Validates: Requirement 6.4 (notify users and guide next steps)
     """
-    try:
-        info_request = await lifecycle_manager.create_additional_info_request(
-            application_id=request.application_id,
-            required_items=request.required_items,
-            due_days=request.due_days
-        )
-        
-        return {
-            "success": True,
-            "request": {
-                "request_id": info_request.request_id,
-                "application_id": info_request.application_id,
-                "requested_at": info_request.requested_at.isoformat(),
-                "due_date": info_request.due_date.isoformat(),
-                "items": info_request.items,
-                "status": info_request.status
-            }
+    info_request = await lifecycle_manager.create_additional_info_request(
+        application_id=request.application_id,
+        required_items=request.required_items,
+        due_days=request.due_days
+    )
+    
+    return {
+        "success": True,
+        "request": {
+            "request_id": info_request.request_id,
+            "application_id": info_request.application_id,
+            "requested_at": info_request.requested_at,
+            "due_date": info_request.due_date,
+            "items": info_request.items,
+            "status": info_request.status
         }
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    }
 
 
 @app.get("/application/{application_id}/additional-info/requests")
@@ -455,31 +623,27 @@ async def get_additional_info_requests(
     
     Validates: Requirement 6.4 (additional information request handling)
     """
-    try:
-        requests = await lifecycle_manager.get_additional_info_requests(
-            application_id,
-            status=status
-        )
-        
-        return {
-            "success": True,
-            "application_id": application_id,
-            "count": len(requests),
-            "requests": [
-                {
-                    "request_id": r.request_id,
-                    "requested_at": r.requested_at.isoformat(),
-                    "due_date": r.due_date.isoformat(),
-                    "items": r.items,
-                    "status": r.status,
-                    "submitted_at": r.submitted_at.isoformat() if r.submitted_at else None
-                }
-                for r in requests
-            ]
-        }
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    requests = await lifecycle_manager.get_additional_info_requests(
+        application_id,
+        status=status
+    )
+    
+    return {
+        "success": True,
+        "application_id": application_id,
+        "count": len(requests),
+        "requests": [
+            {
+                "request_id": r.request_id,
+                "requested_at": r.requested_at,
+                "due_date": r.due_date,
+                "items": r.items,
+                "status": r.status,
+                "submitted_at": r.submitted_at
+            }
+            for r in requests
+        ]
+    }
 
 
 @app.post("/application/additional-info/submit")
@@ -502,30 +666,17 @@ async def submit_additional_info(request: AdditionalInfoSubmission):
             "request": {
                 "request_id": info_request.request_id,
                 "status": info_request.status,
-                "submitted_at": info_request.submitted_at.isoformat() if info_request.submitted_at else None
+                "submitted_at": info_request.submitted_at
             }
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "application-tracker"
-    }
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    await portal_integration.close()
-
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 class OutcomeNotificationRequest(BaseModel):
@@ -538,81 +689,47 @@ class OutcomeNotificationRequest(BaseModel):
     benefit_amount: Optional[str] = None
 
 
-@app.post("/application/outcome/notify")
+@app.post("/application/outcome/notify", responses={200: {"model": OutcomeResponse}})
 async def send_outcome_notification(request: OutcomeNotificationRequest):
     """
     Send notification about application outcome with clear explanation.
     
     Validates: Requirement 6.5 (inform users with clear explanations)
     """
-    try:
-        explanation = await lifecycle_manager.send_outcome_notification(
-            application_id=request.application_id,
-            outcome_type=request.outcome_type,
-            rejection_reason=request.rejection_reason,
-            specific_details=request.specific_details,
-            scheme_name=request.scheme_name,
-            benefit_amount=request.benefit_amount
-        )
-        
-        return {
-            "success": True,
-            "application_id": request.application_id,
-            "outcome": {
-                "type": explanation.outcome_type.value,
-                "date": explanation.outcome_date.isoformat(),
-                "primary_reason": explanation.primary_reason,
-                "detailed_explanation": explanation.detailed_explanation,
-                "supporting_details": explanation.supporting_details,
-                "next_steps": explanation.next_steps,
-                "appeal_eligible": explanation.appeal_eligible,
-                "appeal_deadline": explanation.appeal_deadline.isoformat() if explanation.appeal_deadline else None,
-                "resubmission_allowed": explanation.resubmission_allowed,
-                "contact_info": explanation.contact_info
-            }
-        }
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    explanation = await lifecycle_manager.send_outcome_notification(
+        application_id=request.application_id,
+        outcome_type=request.outcome_type,
+        rejection_reason=request.rejection_reason,
+        specific_details=request.specific_details,
+        scheme_name=request.scheme_name,
+        benefit_amount=request.benefit_amount
+    )
+    
+    return _model_response(OutcomeResponse(
+        application_id=request.application_id,
+        outcome=OutcomeDetails.model_validate(explanation)
+    ))
 
 
-@app.get("/application/{application_id}/outcome")
+@app.get("/application/{application_id}/outcome", responses={200: {"model": OutcomeResponse}})
 async def get_outcome_explanation(application_id: str):
     """
     Get outcome explanation for an application.
     
     Validates: Requirement 6.5 (clear explanations for outcomes)
     """
-    try:
-        explanation = await lifecycle_manager.get_outcome_explanation(application_id)
-        
-        if not explanation:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No outcome found for application {application_id}"
-            )
-        
-        return {
-            "success": True,
-            "application_id": application_id,
-            "outcome": {
-                "type": explanation.outcome_type.value,
-                "date": explanation.outcome_date.isoformat(),
-                "primary_reason": explanation.primary_reason,
-                "detailed_explanation": explanation.detailed_explanation,
-                "supporting_details": explanation.supporting_details,
-                "next_steps": explanation.next_steps,
-                "appeal_eligible": explanation.appeal_eligible,
-                "appeal_deadline": explanation.appeal_deadline.isoformat() if explanation.appeal_deadline else None,
-                "resubmission_allowed": explanation.resubmission_allowed,
-                "contact_info": explanation.contact_info
-            }
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    explanation = await lifecycle_manager.get_outcome_explanation(application_id)
+    
+    if not explanation:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No outcome found for application {application_id}"
+        )
+    
+    return _model_response(OutcomeResponse(
+        application_id=application_id,
+        outcome=OutcomeDetails.model_validate(explanation)
+    ))
 
 
 @app.get("/application/{application_id}/appeal-guidance")
@@ -622,34 +739,28 @@ async def get_appeal_guidance(application_id: str):
     
     Validates: Requirement 6.5 (appeal guidance)
     """
-    try:
-        guidance = await lifecycle_manager.get_appeal_guidance(application_id)
-        
-        if not guidance:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No appeal guidance available for application {application_id}"
-            )
-        
-        return {
-            "success": True,
-            "application_id": application_id,
-            "appeal_guidance": {
-                "eligibility": guidance.eligibility.value,
-                "appeal_deadline": guidance.appeal_deadline.isoformat() if guidance.appeal_deadline else None,
-                "appeal_process": guidance.appeal_process,
-                "required_documents": guidance.required_documents,
-                "submission_methods": guidance.submission_methods,
-                "estimated_timeline": guidance.estimated_timeline,
-                "contact_info": guidance.contact_info,
-                "tips": guidance.tips
-            }
+    guidance = await lifecycle_manager.get_appeal_guidance(application_id)
+    
+    if not guidance:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No appeal guidance available for application {application_id}"
+        )
+    
+    return {
+        "success": True,
+        "application_id": application_id,
+        "appeal_guidance": {
+            "eligibility": guidance.eligibility.value,
+            "appeal_deadline": guidance.appeal_deadline,
+            "appeal_process": guidance.appeal_process,
+            "required_documents": guidance.required_documents,
+            "submission_methods": guidance.submission_methods,
+            "estimated_timeline": guidance.estimated_timeline,
+            "contact_info": guidance.contact_info,
+            "tips": guidance.tips
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    }
 
 
 @app.get("/application/{application_id}/resubmission-guidance")
@@ -659,30 +770,24 @@ async def get_resubmission_guidance(application_id: str):
     
     Validates: Requirement 6.5 (resubmission guidance)
     """
-    try:
-        guidance = await lifecycle_manager.get_resubmission_guidance(application_id)
-        
-        if not guidance:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No resubmission guidance available for application {application_id}"
-            )
-        
-        return {
-            "success": True,
-            "application_id": application_id,
-            "resubmission_guidance": {
-                "resubmission_allowed": guidance.resubmission_allowed,
-                "waiting_period": guidance.waiting_period,
-                "corrections_needed": guidance.corrections_needed,
-                "resubmission_process": guidance.resubmission_process,
-                "documents_to_update": guidance.documents_to_update,
-                "estimated_timeline": guidance.estimated_timeline,
-                "tips": guidance.tips
-            }
+    guidance = await lifecycle_manager.get_resubmission_guidance(application_id)
+    
+    if not guidance:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No resubmission guidance available for application {application_id}"
+        )
+    
+    return {
+        "success": True,
+        "application_id": application_id,
+        "resubmission_guidance": {
+            "resubmission_allowed": guidance.resubmission_allowed,
+            "waiting_period": guidance.waiting_period,
+            "corrections_needed": guidance.corrections_needed,
+            "resubmission_process": guidance.resubmission_process,
+            "documents_to_update": guidance.documents_to_update,
+            "estimated_timeline": guidance.estimated_timeline,
+            "tips": guidance.tips
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in endpoint: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    }
@@ -5,14 +5,49 @@ Implements authorization code flow, token refresh, and PKCE for enhanced securit
 Validates: Requirement 9.4 (token-based authentication for government APIs)
 """
 
+import asyncio
 import secrets
-import hashlib
-import base64
+from hashlib import sha256
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, Tuple
-from urllib.parse import urlencode, parse_qs, urlparse
+from urllib.parse import quote_plus, urlencode
 import httpx
+import orjson
+
+try:
+    # SIMD-accelerated base64 (libbase64); same API as the stdlib function
+    from pybase64 import urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64encode
+
+
+# Headers for form-encoded token endpoint calls (httpx copies them per request)
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# Tokens are treated as expired this many seconds before they actually expire
+_EXPIRY_BUFFER_SECONDS = 60
+
+
+def _token_urlsafe(nbytes: int) -> str:
+    """Random URL-safe base64 text without padding, like secrets.token_urlsafe"""
+    return urlsafe_b64encode(secrets.token_bytes(nbytes)).rstrip(b'=').decode('ascii')
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """
+    HTTP client tuned for token endpoints: short connect/pool waits, a
+    bounded keep-alive pool, and HTTP/2 where the server negotiates it.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0
+        )
+    )
 
 
 class OAuth2Client:
@@ -20,6 +55,16 @@ class OAuth2Client:
     OAuth 2.0 client with PKCE support for secure government portal authentication.
     """
     
+    __slots__ = (
+        'client_id', 'client_secret', 'authorization_endpoint', 'token_endpoint',
+        'redirect_uri', 'scope', 'revoke_endpoint',
+        '_auth_url_prefix', '_token_body_prefix', '_refresh_body_prefix',
+        '_owns_http_client', 'http_client',
+        '_access_token', '_auth_header_value', 'refresh_token',
+        '_token_expires_at', '_refresh_after',
+        '_refresh_lock'
+    )
+    
     def __init__(
         self,
         client_id: str,
@@ -27,7 +72,9 @@ class OAuth2Client:
         authorization_endpoint: str,
         token_endpoint: str,
         redirect_uri: str,
-        scope: Optional[str] = None
+        scope: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        revoke_endpoint: Optional[str] = None
     ):
         """
         Initialize OAuth 2.0 client.
@@ -39,6 +86,10 @@ class OAuth2Client:
             token_endpoint: Token exchange URL
             redirect_uri: Callback URL for authorization
             scope: Requested OAuth scopes
+            http_client: Optional shared HTTP client; when omitted the client
+                creates and owns its own
+            revoke_endpoint: Token revocation URL; derived from the token
+                endpoint ('/token' -> '/revoke') when omitted
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -46,14 +97,74 @@ class OAuth2Client:
         self.token_endpoint = token_endpoint
         self.redirect_uri = redirect_uri
         self.scope = scope or "read write"
+        # Note: Revocation endpoint varies by provider; the derived default
+        # is a generic convention
+        self.revoke_endpoint = revoke_endpoint or token_endpoint.replace('/token', '/revoke')
         
-        # HTTP client for API calls
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # Authorization URL up to the per-request parameters
+        self._auth_url_prefix = f"{authorization_endpoint}?" + urlencode({
+            'response_type': 'code',
+            'client_id': client_id,
+            'redirect_uri': redirect_uri,
+            'scope': self.scope,
+            'code_challenge_method': 'S256'
+        })
+        
+        # Form-encoded token request fields that are fixed per client
+        self._token_body_prefix = urlencode({
+            'grant_type': 'authorization_code',
+            'redirect_uri': redirect_uri,
+            'client_id': client_id,
+            'client_secret': client_secret
+        }).encode('ascii')
+        self._refresh_body_prefix = urlencode({
+            'grant_type': 'refresh_token',
+            'client_id': client_id,
+            'client_secret': client_secret
+        }).encode('ascii')
+        
+        # HTTP client for API calls (closed by close() only if we created it)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or _new_http_client()
         
         # Token storage
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
+        
+        # Serializes refreshes so concurrent callers trigger only one
+        self._refresh_lock = asyncio.Lock()
+    
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current access token"""
+        return self._access_token
+    
+    @access_token.setter
+    def access_token(self, value: Optional[str]):
+        self._access_token = value
+        # Authorization header value, formatted once per token
+        self._auth_header_value = f'Bearer {value}' if value else None
+    
+    @property
+    def token_expires_at(self) -> Optional[datetime]:
+        """Wall-clock (UTC) expiry of the access token"""
+        return self._token_expires_at
+    
+    @token_expires_at.setter
+    def token_expires_at(self, value: Optional[datetime]):
+        self._token_expires_at = value
+        # Monotonic deadline (buffer included) used by is_token_expired
+        if value is None:
+            self._refresh_after: Optional[float] = None
+        else:
+            remaining = (value - datetime.utcnow()).total_seconds()
+            self._refresh_after = time.monotonic() + remaining - _EXPIRY_BUFFER_SECONDS
+    
+    def _set_token_expiry(self, expires_in: float):
+        """Record the expiry of a freshly issued token"""
+        self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+        self._refresh_after = time.monotonic() + expires_in - _EXPIRY_BUFFER_SECONDS
     
     def generate_authorization_url(self, state: Optional[str] = None) -> Tuple[str, str, str]:
         """
@@ -65,41 +176,35 @@ class OAuth2Client:
         Returns:
             Tuple of (authorization_url, state, code_verifier)
         """
-        # Generate state if not provided
-        if not state:
-            state = secrets.token_urlsafe(32)
+        # Generate PKCE code verifier, and state if not provided. Both come
+        # from one random draw: 96 bytes encode to exactly 128 characters,
+        # split into a 43-character state and an 85-character verifier
+        if state:
+            code_verifier = self._generate_code_verifier()
+        else:
+            encoded = _token_urlsafe(96)
+            state, code_verifier = encoded[:43], encoded[43:]
         
-        # Generate PKCE code verifier and challenge
-        code_verifier = self._generate_code_verifier()
         code_challenge = self._generate_code_challenge(code_verifier)
         
-        # Build authorization URL
-        params = {
-            'response_type': 'code',
-            'client_id': self.client_id,
-            'redirect_uri': self.redirect_uri,
-            'scope': self.scope,
-            'state': state,
-            'code_challenge': code_challenge,
-            'code_challenge_method': 'S256'
-        }
-        
-        auth_url = f"{self.authorization_endpoint}?{urlencode(params)}"
+        # Build authorization URL; the challenge is URL-safe base64 already
+        auth_url = f"{self._auth_url_prefix}&state={quote_plus(state)}&code_challenge={code_challenge}"
         
         return auth_url, state, code_verifier
     
     def _generate_code_verifier(self) -> str:
         """Generate PKCE code verifier"""
         # Generate 43-128 character random string
-        return secrets.token_urlsafe(64)
+        return _token_urlsafe(64)
     
     def _generate_code_challenge(self, code_verifier: str) -> str:
         """Generate PKCE code challenge from verifier"""
-        # SHA256 hash of the verifier
-        digest = hashlib.sha256(code_verifier.encode('utf-8')).digest()
-        # Base64 URL-safe encoding without padding
-        challenge = base64.urlsafe_b64encode(digest).decode('utf-8').rstrip('=')
-        return challenge
+        # SHA256 hash of the verifier. hashlib.sha256 is served by OpenSSL's
+        # EVP backend, which uses the CPU's SHA extensions where available;
+        # the verifier is URL-safe base64, so an ASCII encode is sufficient
+        digest = sha256(code_verifier.encode('ascii')).digest()
+        # Base64 URL-safe encoding without padding, stripped while still bytes
+        return urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
     
     async def exchange_code_for_token(
         self,
@@ -116,24 +221,28 @@ class OAuth2Client:
         Returns:
             Token response with access_token, refresh_token, etc.
         """
-        data = {
-            'grant_type': 'authorization_code',
-            'code': authorization_code,
-            'redirect_uri': self.redirect_uri,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'code_verifier': code_verifier
-        }
+        body = b''.join((
+            self._token_body_prefix,
+            b'&code=', quote_plus(authorization_code).encode('ascii'),
+            b'&code_verifier=', quote_plus(code_verifier).encode('ascii')
+        ))
         
         try:
             response = await self.http_client.post(
                 self.token_endpoint,
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                content=body,
+                headers=_FORM_HEADERS
             )
             
-            response.raise_for_status()
-            token_data = response.json()
+            if not response.is_success:
+                return {
+                    'success': False,
+                    'error': 'token_exchange_failed',
+                    'error_description': response.text,
+                    'status_code': response.status_code
+                }
+            
+            token_data = orjson.loads(response.content)
             
             # Store tokens
             self.access_token = token_data.get('access_token')
@@ -141,7 +250,7 @@ class OAuth2Client:
             
             # Calculate expiration
             expires_in = token_data.get('expires_in', 3600)
-            self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            self._set_token_expiry(expires_in)
             
             return {
                 'success': True,
@@ -152,13 +261,6 @@ class OAuth2Client:
                 'expires_at': self.token_expires_at.isoformat(),
                 'scope': token_data.get('scope', self.scope)
             }
-        except httpx.HTTPStatusError as e:
-            return {
-                'success': False,
-                'error': 'token_exchange_failed',
-                'error_description': str(e),
-                'status_code': e.response.status_code
-            }
         except Exception as e:
             return {
                 'success': False,
@@ -180,22 +282,27 @@ class OAuth2Client:
                 'error_description': 'No refresh token available'
             }
         
-        data = {
-            'grant_type': 'refresh_token',
-            'refresh_token': self.refresh_token,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret
-        }
+        body = b''.join((
+            self._refresh_body_prefix,
+            b'&refresh_token=', quote_plus(self.refresh_token).encode('ascii')
+        ))
         
         try:
             response = await self.http_client.post(
                 self.token_endpoint,
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                content=body,
+                headers=_FORM_HEADERS
             )
             
-            response.raise_for_status()
-            token_data = response.json()
+            if not response.is_success:
+                return {
+                    'success': False,
+                    'error': 'token_refresh_failed',
+                    'error_description': response.text,
+                    'status_code': response.status_code
+                }
+            
+            token_data = orjson.loads(response.content)
             
             # Update tokens
             self.access_token = token_data.get('access_token')
@@ -204,7 +311,7 @@ class OAuth2Client:
             
             # Calculate expiration
             expires_in = token_data.get('expires_in', 3600)
-            self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            self._set_token_expiry(expires_in)
             
             return {
                 'success': True,
@@ -214,13 +321,6 @@ class OAuth2Client:
                 'expires_in': expires_in,
                 'expires_at': self.token_expires_at.isoformat()
             }
-        except httpx.HTTPStatusError as e:
-            return {
-                'success': False,
-                'error': 'token_refresh_failed',
-                'error_description': str(e),
-                'status_code': e.response.status_code
-            }
         except Exception as e:
             return {
                 'success': False,
@@ -235,12 +335,8 @@ class OAuth2Client:
         Returns:
             True if token is expired or will expire in next 60 seconds
         """
-        if not self.token_expires_at:
-            return True
-        
-        # Consider token expired if it expires in next 60 seconds
-        buffer = timedelta(seconds=60)
-        return datetime.utcnow() + buffer >= self.token_expires_at
+        refresh_after = self._refresh_after
+        return refresh_after is None or time.monotonic() >= refresh_after
     
     async def get_valid_token(self) -> Optional[str]:
         """
@@ -253,11 +349,18 @@ class OAuth2Client:
         if self.access_token and not self.is_token_expired():
             return self.access_token
         
-        # Try to refresh token
-        if self.refresh_token:
-            result = await self.refresh_access_token()
-            if result['success']:
+        if not self.refresh_token:
+            return None
+        
+        # Only one coroutine refreshes; the rest wait and reuse its token
+        async with self._refresh_lock:
+            if self.access_token and not self.is_token_expired():
                 return self.access_token
+            
+            if self.refresh_token:
+                result = await self.refresh_access_token()
+                if result['success']:
+                    return self.access_token
         
         return None
     
@@ -280,10 +383,6 @@ class OAuth2Client:
                 'error_description': 'No token to revoke'
             }
         
-        # Note: Revocation endpoint varies by provider
-        # This is a generic implementation
-        revoke_endpoint = self.token_endpoint.replace('/token', '/revoke')
-        
         data = {
             'token': token_to_revoke,
             'client_id': self.client_id,
@@ -292,9 +391,9 @@ class OAuth2Client:
         
         try:
             response = await self.http_client.post(
-                revoke_endpoint,
+                self.revoke_endpoint,
                 data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                headers=_FORM_HEADERS
             )
             
             # Clear stored tokens
@@ -338,19 +437,18 @@ class OAuth2Client:
         if not token:
             raise ValueError("Unable to obtain valid access token")
         
-        # Add authorization header
-        headers = kwargs.get('headers', {})
-        headers['Authorization'] = f'Bearer {token}'
-        kwargs['headers'] = headers
+        # Add authorization header on a copy so the caller's headers are untouched
+        headers = {**(kwargs.pop('headers', None) or {}), 'Authorization': self._auth_header_value}
         
         # Make request
-        response = await self.http_client.request(method, url, **kwargs)
+        response = await self.http_client.request(method, url, headers=headers, **kwargs)
         
         return response
     
     async def close(self):
-        """Close HTTP client"""
-        await self.http_client.aclose()
+        """Close HTTP client if this instance owns it"""
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
 
 class OAuth2TokenManager:
@@ -358,9 +456,20 @@ class OAuth2TokenManager:
     Manages multiple OAuth 2.0 clients for different portals.
     """
     
-    def __init__(self):
-        """Initialize token manager"""
+    __slots__ = ('clients', '_owns_http_client', 'http_client')
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize token manager.
+        
+        Args:
+            http_client: Optional HTTP client shared by every registered
+                client; when omitted the manager creates and owns one, so
+                all portals still share a single connection pool
+        """
         self.clients: Dict[str, OAuth2Client] = {}
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or _new_http_client()
     
     def register_client(
         self,
@@ -383,7 +492,9 @@ class OAuth2TokenManager:
             authorization_endpoint=client_config['authorization_endpoint'],
             token_endpoint=client_config['token_endpoint'],
             redirect_uri=client_config['redirect_uri'],
-            scope=client_config.get('scope')
+            scope=client_config.get('scope'),
+            revoke_endpoint=client_config.get('revoke_endpoint'),
+            http_client=self.http_client
         )
         
         self.clients[portal_id] = client
@@ -401,7 +512,36 @@ class OAuth2TokenManager:
         """
         return self.clients.get(portal_id)
     
+    async def refresh_all(self, concurrency: int = 16) -> Dict[str, Dict[str, Any]]:
+        """
+        Refresh the access tokens of all clients holding a refresh token.
+        
+        Args:
+            concurrency: Maximum number of refresh requests in flight
+            
+        Returns:
+            Refresh result per portal identifier
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def refresh(client: OAuth2Client) -> Dict[str, Any]:
+            # Hold the client's refresh lock so get_valid_token callers
+            # wait for this refresh instead of starting their own
+            async with semaphore, client._refresh_lock:
+                return await client.refresh_access_token()
+        
+        portal_ids = [
+            portal_id for portal_id, client in self.clients.items()
+            if client.refresh_token
+        ]
+        results = await asyncio.gather(
+            *(refresh(self.clients[portal_id]) for portal_id in portal_ids)
+        )
+        return dict(zip(portal_ids, results))
+    
     async def close_all(self):
-        """Close all OAuth clients"""
+        """Close all OAuth clients and the shared HTTP client if owned"""
         for client in self.clients.values():
             await client.close()
+        if self._owns_http_client:
+            await self.http_client.aclose()
@@ -6,10 +6,144 @@ appeal guidance, and resubmission instructions.
 Validates: Requirement 6.5
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import sys
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Closing next steps shared by every rejection explanation
+_COMMON_REJECTION_NEXT_STEPS = (
+    "Review the detailed explanation and supporting details carefully",
+    "Contact the helpline for clarification if needed",
+    "Keep your application ID for future reference"
+)
+
+_RESUBMISSION_NEXT_STEP = "You can correct the issues and resubmit your application"
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December"
+)
+
+# Contact values repeated across every generated outcome. The dict keys are
+# identifier-like and already interned by the compiler; these are not
+_HELPLINE = sys.intern("1800-XXX-XXXX")
+_SUPPORT_EMAIL = sys.intern("support@scheme.gov.in")
+_APPEALS_EMAIL = sys.intern("appeals@scheme.gov.in")
+_OFFICE = sys.intern("District Welfare Office")
+_APPEALS_OFFICE = sys.intern("District Welfare Office - Appeals Section")
+
+# contact_info variants; each model gets its own dict() copy because
+# pydantic-core cannot serialize a read-only MappingProxyType view
+_CONTACT_DEFAULT = {"helpline": _HELPLINE, "email": _SUPPORT_EMAIL}
+_CONTACT_WITH_OFFICE = {**_CONTACT_DEFAULT, "office": _OFFICE}
+_CONTACT_APPEALS = {"helpline": _HELPLINE, "email": _APPEALS_EMAIL, "office": _APPEALS_OFFICE}
+
+# Partial approvals leave 30 days to follow up on pending components
+_PARTIAL_DEADLINE = timedelta(days=30)
+
+# Fixed guidance content, copied into each generated model
+_APPROVAL_SUPPORTING_DETAILS = (
+    "All eligibility criteria verified successfully",
+    "Documents validated and accepted",
+    "Application processed and approved by authorized officer"
+)
+
+_APPROVAL_NEXT_STEPS = (
+    "Benefits will be disbursed to your registered bank account",
+    "You will receive a confirmation SMS/email with disbursement details",
+    "Keep your confirmation number for future reference",
+    "Contact the helpline if you don't receive benefits within the expected timeline"
+)
+
+_PARTIAL_SUPPORTING_DETAILS = (
+    "Some eligibility criteria met",
+    "Additional verification required for certain components"
+)
+
+_PARTIAL_NEXT_STEPS = (
+    "Review which components were approved",
+    "Submit additional information for pending components",
+    "Approved benefits will be processed separately",
+    "Contact the office for details on pending items"
+)
+
+_APPEAL_NOT_ELIGIBLE_TIPS = (
+    "Appeals are not available for this rejection reason",
+    "Consider resubmitting with corrections if allowed",
+    "Contact the helpline for alternative options"
+)
+
+_APPEAL_EXPIRED_TIPS_TAIL = (
+    "Consider resubmitting a new application if eligible",
+    "Contact the office for exceptional circumstances"
+)
+
+_APPEAL_BASE_TIPS = (
+    "Submit your appeal as early as possible within the deadline",
+    "Be specific and factual in your appeal letter",
+    "Include all relevant supporting documents",
+    "Keep copies of all submitted documents",
+    "Follow up regularly on your appeal status"
+)
+
+_APPEAL_PROCESS_STEPS = (
+    {
+        "step": "1. Prepare Appeal Letter",
+        "description": "Write a clear letter explaining why the decision should be reconsidered. "
+                      "Include your application ID and specific reasons for appeal."
+    },
+    {
+        "step": "2. Gather Supporting Documents",
+        "description": "Collect all documents that support your appeal, including any missing "
+                      "or corrected documents from the original application."
+    },
+    {
+        "step": "3. Complete Appeal Form",
+        "description": "Fill out the official appeal form available on the portal or at the district office."
+    },
+    {
+        "step": "4. Submit Appeal",
+        "description": "Submit your appeal through one of the available methods before the deadline."
+    },
+    {
+        "step": "5. Track Appeal Status",
+        "description": "Use your appeal reference number to track the status of your appeal."
+    }
+)
+
+_RESUBMISSION_NOT_ALLOWED_TIPS = (
+    "Resubmission is not allowed for this rejection reason",
+    "Consider filing an appeal if eligible",
+    "Contact the helpline for alternative options"
+)
+
+_RESUBMISSION_PROCESS_STEPS = (
+    {
+        "step": "1. Review Rejection Details",
+        "description": "Carefully review the rejection reason and all specific issues mentioned."
+    },
+    {
+        "step": "2. Correct All Issues",
+        "description": "Address each issue mentioned in the rejection. Gather corrected or missing documents."
+    },
+    {
+        "step": "3. Verify Eligibility",
+        "description": "Ensure you meet all eligibility criteria before resubmitting."
+    },
+    {
+        "step": "4. Prepare New Application",
+        "description": "Fill out a fresh application form with corrected information."
+    },
+    {
+        "step": "5. Submit Application",
+        "description": "Submit the new application through the portal. You will receive a new confirmation number."
+    }
+)
 
 
 class OutcomeType(str, Enum):
@@ -38,7 +172,29 @@ class AppealEligibility(str, Enum):
     EXPIRED = "expired"
 
 
-class OutcomeExplanation(BaseModel):
+# OutcomeExplanationSystem builds the models below from its own templates
+# and already-validated inputs, so it uses model_construct to skip
+# re-validation; construct them normally at external boundaries
+class _OutcomeModel(BaseModel):
+    """Base for the outcome models; serializes straight to JSON-ready output.
+
+    Use to_dict()/to_json() rather than model_dump() followed by a separate
+    JSON encoding pass, which walks the nested step lists twice.
+    """
+
+    # Generated outcomes are value objects; nothing reassigns their fields
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump to a dict of JSON-native values in a single traversal"""
+        return self.model_dump(mode="json", exclude_none=True)
+
+    def to_json(self) -> bytes:
+        """Serialize with pydantic-core, skipping the intermediate Python dict"""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+
+class OutcomeExplanation(_OutcomeModel):
     """Detailed explanation of application outcome"""
     application_id: str
     outcome_type: OutcomeType
@@ -50,10 +206,10 @@ class OutcomeExplanation(BaseModel):
     appeal_eligible: bool = False
     appeal_deadline: Optional[datetime] = None
     resubmission_allowed: bool = False
-    contact_info: Optional[Dict[str, str]] = None
+    contact_info: Dict[str, str] = Field(default_factory=dict)
 
 
-class AppealGuidance(BaseModel):
+class AppealGuidance(_OutcomeModel):
     """Guidance for filing an appeal"""
     application_id: str
     eligibility: AppealEligibility
@@ -66,7 +222,7 @@ class AppealGuidance(BaseModel):
     tips: List[str] = Field(default_factory=list)
 
 
-class ResubmissionGuidance(BaseModel):
+class ResubmissionGuidance(_OutcomeModel):
     """Guidance for resubmitting an application"""
     application_id: str
     resubmission_allowed: bool
@@ -78,131 +234,288 @@ class ResubmissionGuidance(BaseModel):
     tips: List[str] = Field(default_factory=list)
 
 
+# Guidance for the early-return branches, differing per call only in the
+# application (and deadline). model_copy just copies the field dict, while
+# model_construct resolves every unset default_factory through
+# inspect.signature on each call. Updates pass fresh lists so copies never
+# alias the template's
+_APPEAL_NOT_ELIGIBLE_TEMPLATE = AppealGuidance.model_construct(
+    application_id="",
+    eligibility=AppealEligibility.NOT_ELIGIBLE,
+    appeal_deadline=None,
+    appeal_process=[],
+    required_documents=[],
+    submission_methods=[],
+    estimated_timeline="N/A",
+    contact_info={},
+    tips=[]
+)
+
+_APPEAL_EXPIRED_TEMPLATE = _APPEAL_NOT_ELIGIBLE_TEMPLATE.model_copy(
+    update={"eligibility": AppealEligibility.EXPIRED}
+)
+
+_RESUBMISSION_NOT_ALLOWED_TEMPLATE = ResubmissionGuidance.model_construct(
+    application_id="",
+    resubmission_allowed=False,
+    waiting_period=None,
+    corrections_needed=[],
+    resubmission_process=[],
+    documents_to_update=[],
+    estimated_timeline="N/A",
+    tips=[]
+)
+
+
+class _RejectionTemplate(NamedTuple):
+    """Rejection template fields as read by the generators"""
+    primary: str
+    explanation: str
+    appeal_eligible: bool
+    resubmission_allowed: bool
+    next_steps_tail: Tuple[str, ...]
+
+
+# Resubmission guidance per rejection reason, looked up once per call
+_DEFAULT_CORRECTIONS: Dict[RejectionReason, Tuple[Dict[str, str], ...]] = {
+    RejectionReason.INCOMPLETE_DOCUMENTS: (
+        {
+            "issue": "Missing Documents",
+            "correction": "Submit all required documents as per the scheme checklist"
+        },
+    ),
+    RejectionReason.INVALID_INFORMATION: (
+        {
+            "issue": "Incorrect Information",
+            "correction": "Verify and correct all information with supporting documents"
+        },
+    ),
+    RejectionReason.MISSING_CRITERIA: (
+        {
+            "issue": "Eligibility Criteria Not Met",
+            "correction": "Review eligibility requirements and provide evidence of meeting criteria"
+        },
+    ),
+    RejectionReason.EXPIRED_DOCUMENTS: (
+        {
+            "issue": "Expired Documents",
+            "correction": "Obtain fresh, valid copies of all expired documents"
+        },
+    ),
+    RejectionReason.TECHNICAL_ERROR: (
+        {
+            "issue": "Technical Processing Error",
+            "correction": "Resubmit the same application - no changes needed"
+        },
+    )
+}
+
+_FALLBACK_CORRECTION: Tuple[Dict[str, str], ...] = (
+    {
+        "issue": "Application Issues",
+        "correction": "Review rejection details and correct all mentioned issues"
+    },
+)
+
+_DOCUMENTS_TO_UPDATE: Dict[RejectionReason, Tuple[Dict[str, str], ...]] = {
+    RejectionReason.EXPIRED_DOCUMENTS: (
+        {
+            "document": "All Expired Documents",
+            "action": "Obtain fresh copies with current validity"
+        },
+    ),
+    RejectionReason.INCOMPLETE_DOCUMENTS: (
+        {
+            "document": "Missing Documents",
+            "action": "Submit all documents from the required checklist"
+        },
+    ),
+    RejectionReason.INVALID_INFORMATION: (
+        {
+            "document": "Verification Documents",
+            "action": "Provide documents that verify the corrected information"
+        },
+    )
+}
+
+
+def _format_date(day: date) -> str:
+    """
+    Format a date or datetime like strftime('%d %B %Y') without locale
+    lookups. Shared with lifecycle_management for notification messages
+    """
+    return f"{day.day:02d} {_MONTHS[day.month - 1]} {day.year}"
+
+
+@lru_cache(maxsize=256)
+def _approval_text(scheme_name: Optional[str], benefit_amount: Optional[str]) -> Tuple[str, str]:
+    """Primary reason and detailed explanation for an approval"""
+    scheme_text = f" for {scheme_name}" if scheme_name else ""
+    
+    detailed_explanation = (
+        f"Congratulations! Your application has been approved{scheme_text}. "
+        f"You have been found eligible and all requirements have been satisfied. "
+    )
+    
+    if benefit_amount:
+        detailed_explanation += f"You will receive benefits of {benefit_amount}. "
+    
+    detailed_explanation += (
+        "The benefits will be processed and disbursed according to the scheme guidelines."
+    )
+    
+    return f"Application approved{scheme_text}", detailed_explanation
+
+
+@lru_cache(maxsize=None)
+def _appeal_tips(rejection_reason: RejectionReason) -> Tuple[str, ...]:
+    """Appeal tips for a rejection reason"""
+    tips = _APPEAL_BASE_TIPS
+    
+    if rejection_reason == RejectionReason.INCOMPLETE_DOCUMENTS:
+        tips += ("Ensure all previously missing documents are included with the appeal",)
+    elif rejection_reason == RejectionReason.INVALID_INFORMATION:
+        tips += ("Provide verified documents to support the corrected information",)
+    elif rejection_reason == RejectionReason.INELIGIBLE:
+        tips += ("Clearly explain how you meet the eligibility criteria with evidence",)
+    
+    return tips
+
+
+# Rejection templates and appeal/resubmission rules. Read-only, built
+# once at import, and the only source the generators read
+_REJECTION_TEMPLATES: Mapping[RejectionReason, Mapping[str, Any]] = MappingProxyType({
+    RejectionReason.INCOMPLETE_DOCUMENTS: MappingProxyType({
+        "primary": "Application rejected due to incomplete documentation",
+        "explanation": "Your application could not be processed because required documents were missing or incomplete. "
+                      "All mandatory documents must be submitted for the application to be considered.",
+        "appeal_eligible": True,
+        "resubmission_allowed": True
+    }),
+    RejectionReason.INELIGIBLE: MappingProxyType({
+        "primary": "Application rejected - eligibility criteria not met",
+        "explanation": "After careful review, we found that you do not meet the eligibility criteria for this scheme. "
+                      "Eligibility is determined based on specific requirements such as income, age, occupation, or location.",
+        "appeal_eligible": True,
+        "resubmission_allowed": False
+    }),
+    RejectionReason.DUPLICATE_APPLICATION: MappingProxyType({
+        "primary": "Application rejected - duplicate submission detected",
+        "explanation": "Our records show that you have already submitted an application for this scheme. "
+                      "Multiple applications for the same scheme are not allowed.",
+        "appeal_eligible": False,
+        "resubmission_allowed": False
+    }),
+    RejectionReason.INVALID_INFORMATION: MappingProxyType({
+        "primary": "Application rejected due to invalid or incorrect information",
+        "explanation": "The information provided in your application could not be verified or was found to be incorrect. "
+                      "All information must be accurate and verifiable.",
+        "appeal_eligible": True,
+        "resubmission_allowed": True
+    }),
+    RejectionReason.MISSING_CRITERIA: MappingProxyType({
+        "primary": "Application rejected - required criteria not satisfied",
+        "explanation": "Your application does not satisfy one or more mandatory criteria for this scheme. "
+                      "Please review the scheme requirements carefully.",
+        "appeal_eligible": True,
+        "resubmission_allowed": True
+    }),
+    RejectionReason.EXPIRED_DOCUMENTS: MappingProxyType({
+        "primary": "Application rejected due to expired documents",
+        "explanation": "One or more documents submitted with your application have expired. "
+                      "All documents must be valid and current at the time of submission.",
+        "appeal_eligible": False,
+        "resubmission_allowed": True
+    }),
+    RejectionReason.TECHNICAL_ERROR: MappingProxyType({
+        "primary": "Application rejected due to technical processing error",
+        "explanation": "Your application could not be processed due to a technical error in our system. "
+                      "This is not related to your eligibility or documentation.",
+        "appeal_eligible": False,
+        "resubmission_allowed": True
+    }),
+    RejectionReason.OTHER: MappingProxyType({
+        "primary": "Application rejected",
+        "explanation": "Your application has been rejected. Please contact the department for specific details.",
+        "appeal_eligible": True,
+        "resubmission_allowed": True
+    })
+})
+
+_APPEAL_RULES: Mapping[str, Any] = MappingProxyType({
+    "appeal_window_days": 30,  # Days from rejection to file appeal
+    "processing_time": "30-45 days",
+    "required_documents": (
+        MappingProxyType({
+            "name": "Appeal Letter",
+            "description": "Written statement explaining why you believe the decision should be reconsidered"
+        }),
+        MappingProxyType({
+            "name": "Original Application Copy",
+            "description": "Copy of your original application with confirmation number"
+        }),
+        MappingProxyType({
+            "name": "Supporting Evidence",
+            "description": "Any additional documents or evidence supporting your appeal"
+        })
+    ),
+    "submission_methods": (
+        MappingProxyType({
+            "method": "Online Portal",
+            "description": "Submit through the government portal using your application ID"
+        }),
+        MappingProxyType({
+            "method": "District Office",
+            "description": "Submit in person at your district welfare office"
+        }),
+        MappingProxyType({
+            "method": "Registered Post",
+            "description": "Mail to the department address with acknowledgment"
+        })
+    )
+})
+
+_RESUBMISSION_RULES: Mapping[str, Any] = MappingProxyType({
+    "default_waiting_period": 0,  # Days to wait before resubmission
+    "processing_time": "15-30 days",
+    "general_tips": (
+        "Review all eligibility criteria carefully before resubmitting",
+        "Ensure all documents are current and valid",
+        "Double-check all information for accuracy",
+        "Keep copies of all submitted documents",
+        "Note your new confirmation number for tracking"
+    )
+})
+
+_APPEAL_WINDOW_DAYS: int = _APPEAL_RULES["appeal_window_days"]
+_APPEAL_WINDOW = timedelta(days=_APPEAL_WINDOW_DAYS)
+
+# Templates flattened into tuples for the generators; only the appeal
+# step, which carries the deadline, is formatted per call
+_REJECTION_FAST: Mapping[RejectionReason, _RejectionTemplate] = MappingProxyType({
+    reason: _RejectionTemplate(
+        template["primary"],
+        template["explanation"],
+        template["appeal_eligible"],
+        template["resubmission_allowed"],
+        ((_RESUBMISSION_NEXT_STEP,) if template["resubmission_allowed"] else ())
+        + _COMMON_REJECTION_NEXT_STEPS
+    )
+    for reason, template in _REJECTION_TEMPLATES.items()
+})
+
+
 class OutcomeExplanationSystem:
     """
     System for generating clear explanations of application outcomes
     and providing guidance for appeals and resubmissions.
     """
 
-    def __init__(self):
-        """Initialize the outcome explanation system"""
-        # Rejection reason templates
-        self.rejection_templates = self._initialize_rejection_templates()
-        
-        # Appeal eligibility rules
-        self.appeal_rules = self._initialize_appeal_rules()
-        
-        # Resubmission rules
-        self.resubmission_rules = self._initialize_resubmission_rules()
-
-    def _initialize_rejection_templates(self) -> Dict[RejectionReason, Dict[str, Any]]:
-        """Initialize templates for rejection explanations"""
-        return {
-            RejectionReason.INCOMPLETE_DOCUMENTS: {
-                "primary": "Application rejected due to incomplete documentation",
-                "explanation": "Your application could not be processed because required documents were missing or incomplete. "
-                              "All mandatory documents must be submitted for the application to be considered.",
-                "appeal_eligible": True,
-                "resubmission_allowed": True
-            },
-            RejectionReason.INELIGIBLE: {
-                "primary": "Application rejected - eligibility criteria not met",
-                "explanation": "After careful review, we found that you do not meet the eligibility criteria for this scheme. "
-                              "Eligibility is determined based on specific requirements such as income, age, occupation, or location.",
-                "appeal_eligible": True,
-                "resubmission_allowed": False
-            },
-            RejectionReason.DUPLICATE_APPLICATION: {
-                "primary": "Application rejected - duplicate submission detected",
-                "explanation": "Our records show that you have already submitted an application for this scheme. "
-                              "Multiple applications for the same scheme are not allowed.",
-                "appeal_eligible": False,
-                "resubmission_allowed": False
-            },
-            RejectionReason.INVALID_INFORMATION: {
-                "primary": "Application rejected due to invalid or incorrect information",
-                "explanation": "The information provided in your application could not be verified or was found to be incorrect. "
-                              "All information must be accurate and verifiable.",
-                "appeal_eligible": True,
-                "resubmission_allowed": True
-            },
-            RejectionReason.MISSING_CRITERIA: {
-                "primary": "Application rejected - required criteria not satisfied",
-                "explanation": "Your application does not satisfy one or more mandatory criteria for this scheme. "
-                              "Please review the scheme requirements carefully.",
-                "appeal_eligible": True,
-                "resubmission_allowed": True
-            },
-            RejectionReason.EXPIRED_DOCUMENTS: {
-                "primary": "Application rejected due to expired documents",
-                "explanation": "One or more documents submitted with your application have expired. "
-                              "All documents must be valid and current at the time of submission.",
-                "appeal_eligible": False,
-                "resubmission_allowed": True
-            },
-            RejectionReason.TECHNICAL_ERROR: {
-                "primary": "Application rejected due to technical processing error",
-                "explanation": "Your application could not be processed due to a technical error in our system. "
-                              "This is not related to your eligibility or documentation.",
-                "appeal_eligible": False,
-                "resubmission_allowed": True
-            },
-            RejectionReason.OTHER: {
-                "primary": "Application rejected",
-                "explanation": "Your application has been rejected. Please contact the department for specific details.",
-                "appeal_eligible": True,
-                "resubmission_allowed": True
-            }
-        }
-
-    def _initialize_appeal_rules(self) -> Dict[str, Any]:
-        """Initialize rules for appeal eligibility"""
-        return {
-            "appeal_window_days": 30,  # Days from rejection to file appeal
-            "processing_time": "30-45 days",
-            "required_documents": [
-                {
-                    "name": "Appeal Letter",
-                    "description": "Written statement explaining why you believe the decision should be reconsidered"
-                },
-                {
-                    "name": "Original Application Copy",
-                    "description": "Copy of your original application with confirmation number"
-                },
-                {
-                    "name": "Supporting Evidence",
-                    "description": "Any additional documents or evidence supporting your appeal"
-                }
-            ],
-            "submission_methods": [
-                {
-                    "method": "Online Portal",
-                    "description": "Submit through the government portal using your application ID"
-                },
-                {
-                    "method": "District Office",
-                    "description": "Submit in person at your district welfare office"
-                },
-                {
-                    "method": "Registered Post",
-                    "description": "Mail to the department address with acknowledgment"
-                }
-            ]
-        }
-
-    def _initialize_resubmission_rules(self) -> Dict[str, Any]:
-        """Initialize rules for resubmission"""
-        return {
-            "default_waiting_period": 0,  # Days to wait before resubmission
-            "processing_time": "15-30 days",
-            "general_tips": [
-                "Review all eligibility criteria carefully before resubmitting",
-                "Ensure all documents are current and valid",
-                "Double-check all information for accuracy",
-                "Keep copies of all submitted documents",
-                "Note your new confirmation number for tracking"
-            ]
-        }
+    # Read-only views of the module tables the generators use; there is
+    # no per-instance state to build
+    rejection_templates: Mapping[RejectionReason, Mapping[str, Any]] = _REJECTION_TEMPLATES
+    appeal_rules: Mapping[str, Any] = _APPEAL_RULES
+    resubmission_rules: Mapping[str, Any] = _RESUBMISSION_RULES
 
     def generate_outcome_explanation(
         self,
@@ -229,8 +542,46 @@ class OutcomeExplanationSystem:
             
         Validates: Requirement 6.5 (inform users with clear explanations)
         """
-        outcome_date = datetime.now()
+        return self._generate_outcome_explanation(
+            datetime.now(),
+            application_id,
+            outcome_type,
+            rejection_reason,
+            specific_details,
+            scheme_name,
+            benefit_amount
+        )
+
+    def generate_outcome_explanations_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[OutcomeExplanation]:
+        """
+        Generate explanations for many outcomes decided together.
         
+        Args:
+            requests: Keyword arguments for generate_outcome_explanation,
+                one dict per application
+            
+        Returns:
+            OutcomeExplanations in the same order as requests, all sharing
+            one outcome date
+        """
+        outcome_date = datetime.now()
+        generate = self._generate_outcome_explanation
+        return [generate(outcome_date, **request) for request in requests]
+
+    def _generate_outcome_explanation(
+        self,
+        outcome_date: datetime,
+        application_id: str,
+        outcome_type: OutcomeType,
+        rejection_reason: Optional[RejectionReason] = None,
+        specific_details: Optional[List[str]] = None,
+        scheme_name: Optional[str] = None,
+        benefit_amount: Optional[str] = None
+    ) -> OutcomeExplanation:
+        """Dispatch to the generator for outcome_type"""
         if outcome_type == OutcomeType.APPROVED:
             return self._generate_approval_explanation(
                 application_id,
@@ -262,50 +613,19 @@ class OutcomeExplanationSystem:
         specific_details: Optional[List[str]]
     ) -> OutcomeExplanation:
         """Generate explanation for approved application"""
-        scheme_text = f" for {scheme_name}" if scheme_name else ""
-        benefit_text = f" of {benefit_amount}" if benefit_amount else ""
-        
-        primary_reason = f"Application approved{scheme_text}"
-        
-        detailed_explanation = (
-            f"Congratulations! Your application has been approved{scheme_text}. "
-            f"You have been found eligible and all requirements have been satisfied. "
-        )
+        primary_reason, detailed_explanation = _approval_text(scheme_name, benefit_amount)
         
-        if benefit_amount:
-            detailed_explanation += f"You will receive benefits{benefit_text}. "
-        
-        detailed_explanation += (
-            "The benefits will be processed and disbursed according to the scheme guidelines."
-        )
-        
-        supporting_details = specific_details or [
-            "All eligibility criteria verified successfully",
-            "Documents validated and accepted",
-            "Application processed and approved by authorized officer"
-        ]
-        
-        next_steps = [
-            "Benefits will be disbursed to your registered bank account",
-            "You will receive a confirmation SMS/email with disbursement details",
-            "Keep your confirmation number for future reference",
-            "Contact the helpline if you don't receive benefits within the expected timeline"
-        ]
-        
-        return OutcomeExplanation(
+        return OutcomeExplanation.model_construct(
             application_id=application_id,
             outcome_type=OutcomeType.APPROVED,
             outcome_date=outcome_date,
             primary_reason=primary_reason,
             detailed_explanation=detailed_explanation,
-            supporting_details=supporting_details,
-            next_steps=next_steps,
+            supporting_details=list(specific_details or _APPROVAL_SUPPORTING_DETAILS),
+            next_steps=list(_APPROVAL_NEXT_STEPS),
             appeal_eligible=False,
             resubmission_allowed=False,
-            contact_info={
-                "helpline": "1800-XXX-XXXX",
-                "email": "support@scheme.gov.in"
-            }
+            contact_info=dict(_CONTACT_DEFAULT)
         )
 
     def _generate_rejection_explanation(
@@ -316,47 +636,32 @@ class OutcomeExplanationSystem:
         specific_details: Optional[List[str]]
     ) -> OutcomeExplanation:
         """Generate explanation for rejected application"""
-        template = self.rejection_templates[rejection_reason]
-        
-        appeal_deadline = None
-        if template["appeal_eligible"]:
-            appeal_deadline = outcome_date + timedelta(
-                days=self.appeal_rules["appeal_window_days"]
-            )
-        
-        next_steps = []
-        
-        if template["appeal_eligible"]:
-            next_steps.append(
-                f"You can file an appeal within {self.appeal_rules['appeal_window_days']} days "
-                f"(by {appeal_deadline.strftime('%d %B %Y')})"
-            )
-        
-        if template["resubmission_allowed"]:
-            next_steps.append("You can correct the issues and resubmit your application")
-        
-        next_steps.extend([
-            "Review the detailed explanation and supporting details carefully",
-            "Contact the helpline for clarification if needed",
-            "Keep your application ID for future reference"
-        ])
+        template = _REJECTION_FAST[rejection_reason]
+        
+        if template.appeal_eligible:
+            window_days = _APPEAL_WINDOW_DAYS
+            appeal_deadline = outcome_date + _APPEAL_WINDOW
+            next_steps = [
+                f"You can file an appeal within {window_days} days "
+                f"(by {_format_date(appeal_deadline)})",
+                *template.next_steps_tail
+            ]
+        else:
+            appeal_deadline = None
+            next_steps = list(template.next_steps_tail)
         
-        return OutcomeExplanation(
+        return OutcomeExplanation.model_construct(
             application_id=application_id,
             outcome_type=OutcomeType.REJECTED,
             outcome_date=outcome_date,
-            primary_reason=template["primary"],
-            detailed_explanation=template["explanation"],
-            supporting_details=specific_details or [],
+            primary_reason=template.primary,
+            detailed_explanation=template.explanation,
+            supporting_details=list(specific_details or ()),
             next_steps=next_steps,
-            appeal_eligible=template["appeal_eligible"],
+            appeal_eligible=template.appeal_eligible,
             appeal_deadline=appeal_deadline,
-            resubmission_allowed=template["resubmission_allowed"],
-            contact_info={
-                "helpline": "1800-XXX-XXXX",
-                "email": "support@scheme.gov.in",
-                "office": "District Welfare Office"
-            }
+            resubmission_allowed=template.resubmission_allowed,
+            contact_info=dict(_CONTACT_WITH_OFFICE)
         )
 
     def _generate_partial_approval_explanation(
@@ -366,7 +671,7 @@ class OutcomeExplanationSystem:
         specific_details: Optional[List[str]]
     ) -> OutcomeExplanation:
         """Generate explanation for partially approved application"""
-        return OutcomeExplanation(
+        return OutcomeExplanation.model_construct(
             application_id=application_id,
             outcome_type=OutcomeType.PARTIALLY_APPROVED,
             outcome_date=outcome_date,
@@ -375,23 +680,12 @@ class OutcomeExplanationSystem:
                 "Your application has been partially approved. Some components of your application "
                 "have been accepted while others require additional review or documentation."
             ),
-            supporting_details=specific_details or [
-                "Some eligibility criteria met",
-                "Additional verification required for certain components"
-            ],
-            next_steps=[
-                "Review which components were approved",
-                "Submit additional information for pending components",
-                "Approved benefits will be processed separately",
-                "Contact the office for details on pending items"
-            ],
+            supporting_details=list(specific_details or _PARTIAL_SUPPORTING_DETAILS),
+            next_steps=list(_PARTIAL_NEXT_STEPS),
             appeal_eligible=True,
-            appeal_deadline=outcome_date + timedelta(days=30),
+            appeal_deadline=outcome_date + _PARTIAL_DEADLINE,
             resubmission_allowed=True,
-            contact_info={
-                "helpline": "1800-XXX-XXXX",
-                "email": "support@scheme.gov.in"
-            }
+            contact_info=dict(_CONTACT_DEFAULT)
         )
 
     def generate_appeal_guidance(
@@ -414,101 +708,45 @@ class OutcomeExplanationSystem:
         Validates: Requirement 6.5 (appeal guidance)
         """
         # Check appeal eligibility
-        template = self.rejection_templates[rejection_reason]
-        
-        if not template["appeal_eligible"]:
-            return AppealGuidance(
-                application_id=application_id,
-                eligibility=AppealEligibility.NOT_ELIGIBLE,
-                estimated_timeline="N/A",
-                contact_info={
-                    "helpline": "1800-XXX-XXXX",
-                    "email": "support@scheme.gov.in"
-                },
-                tips=[
-                    "Appeals are not available for this rejection reason",
-                    "Consider resubmitting with corrections if allowed",
-                    "Contact the helpline for alternative options"
-                ]
-            )
+        if not _REJECTION_FAST[rejection_reason].appeal_eligible:
+            return _APPEAL_NOT_ELIGIBLE_TEMPLATE.model_copy(update={
+                "application_id": application_id,
+                "appeal_process": [],
+                "required_documents": [],
+                "submission_methods": [],
+                "contact_info": dict(_CONTACT_DEFAULT),
+                "tips": list(_APPEAL_NOT_ELIGIBLE_TIPS)
+            })
         
         # Check if appeal window has expired
-        appeal_deadline = rejection_date + timedelta(
-            days=self.appeal_rules["appeal_window_days"]
-        )
+        appeal_deadline = rejection_date + _APPEAL_WINDOW
         
         if datetime.now() > appeal_deadline:
-            return AppealGuidance(
-                application_id=application_id,
-                eligibility=AppealEligibility.EXPIRED,
-                appeal_deadline=appeal_deadline,
-                estimated_timeline="N/A",
-                contact_info={
-                    "helpline": "1800-XXX-XXXX",
-                    "email": "support@scheme.gov.in"
-                },
-                tips=[
-                    f"Appeal window expired on {appeal_deadline.strftime('%d %B %Y')}",
-                    "Consider resubmitting a new application if eligible",
-                    "Contact the office for exceptional circumstances"
+            return _APPEAL_EXPIRED_TEMPLATE.model_copy(update={
+                "application_id": application_id,
+                "appeal_deadline": appeal_deadline,
+                "appeal_process": [],
+                "required_documents": [],
+                "submission_methods": [],
+                "contact_info": dict(_CONTACT_DEFAULT),
+                "tips": [
+                    f"Appeal window expired on {_format_date(appeal_deadline)}",
+                    *_APPEAL_EXPIRED_TIPS_TAIL
                 ]
-            )
-        
-        # Generate appeal process steps
-        appeal_process = [
-            {
-                "step": "1. Prepare Appeal Letter",
-                "description": "Write a clear letter explaining why the decision should be reconsidered. "
-                              "Include your application ID and specific reasons for appeal."
-            },
-            {
-                "step": "2. Gather Supporting Documents",
-                "description": "Collect all documents that support your appeal, including any missing "
-                              "or corrected documents from the original application."
-            },
-            {
-                "step": "3. Complete Appeal Form",
-                "description": "Fill out the official appeal form available on the portal or at the district office."
-            },
-            {
-                "step": "4. Submit Appeal",
-                "description": "Submit your appeal through one of the available methods before the deadline."
-            },
-            {
-                "step": "5. Track Appeal Status",
-                "description": "Use your appeal reference number to track the status of your appeal."
-            }
-        ]
+            })
         
         # Generate tips based on rejection reason
-        tips = [
-            "Submit your appeal as early as possible within the deadline",
-            "Be specific and factual in your appeal letter",
-            "Include all relevant supporting documents",
-            "Keep copies of all submitted documents",
-            "Follow up regularly on your appeal status"
-        ]
-        
-        if rejection_reason == RejectionReason.INCOMPLETE_DOCUMENTS:
-            tips.append("Ensure all previously missing documents are included with the appeal")
-        elif rejection_reason == RejectionReason.INVALID_INFORMATION:
-            tips.append("Provide verified documents to support the corrected information")
-        elif rejection_reason == RejectionReason.INELIGIBLE:
-            tips.append("Clearly explain how you meet the eligibility criteria with evidence")
+        tips = list(_appeal_tips(rejection_reason))
         
-        return AppealGuidance(
+        return AppealGuidance.model_construct(
             application_id=application_id,
             eligibility=AppealEligibility.ELIGIBLE,
             appeal_deadline=appeal_deadline,
-            appeal_process=appeal_process,
-            required_documents=self.appeal_rules["required_documents"],
-            submission_methods=self.appeal_rules["submission_methods"],
-            estimated_timeline=self.appeal_rules["processing_time"],
-            contact_info={
-                "helpline": "1800-XXX-XXXX",
-                "email": "appeals@scheme.gov.in",
-                "office": "District Welfare Office - Appeals Section"
-            },
+            appeal_process=[dict(step) for step in _APPEAL_PROCESS_STEPS],
+            required_documents=[dict(document) for document in _APPEAL_RULES["required_documents"]],
+            submission_methods=[dict(method) for method in _APPEAL_RULES["submission_methods"]],
+            estimated_timeline=_APPEAL_RULES["processing_time"],
+            contact_info=dict(_CONTACT_APPEALS),
             tips=tips
         )
 
@@ -531,130 +769,44 @@ class OutcomeExplanationSystem:
             
         Validates: Requirement 6.5 (resubmission guidance)
         """
-        template = self.rejection_templates[rejection_reason]
-        
-        if not template["resubmission_allowed"]:
-            return ResubmissionGuidance(
-                application_id=application_id,
-                resubmission_allowed=False,
-                estimated_timeline="N/A",
-                tips=[
-                    "Resubmission is not allowed for this rejection reason",
-                    "Consider filing an appeal if eligible",
-                    "Contact the helpline for alternative options"
-                ]
-            )
+        if not _REJECTION_FAST[rejection_reason].resubmission_allowed:
+            return _RESUBMISSION_NOT_ALLOWED_TEMPLATE.model_copy(update={
+                "application_id": application_id,
+                "corrections_needed": [],
+                "resubmission_process": [],
+                "documents_to_update": [],
+                "tips": list(_RESUBMISSION_NOT_ALLOWED_TIPS)
+            })
         
         # Generate corrections needed based on rejection reason
-        corrections_needed = specific_corrections or self._get_default_corrections(rejection_reason)
-        
-        # Generate resubmission process
-        resubmission_process = [
-            {
-                "step": "1. Review Rejection Details",
-                "description": "Carefully review the rejection reason and all specific issues mentioned."
-            },
-            {
-                "step": "2. Correct All Issues",
-                "description": "Address each issue mentioned in the rejection. Gather corrected or missing documents."
-            },
-            {
-                "step": "3. Verify Eligibility",
-                "description": "Ensure you meet all eligibility criteria before resubmitting."
-            },
-            {
-                "step": "4. Prepare New Application",
-                "description": "Fill out a fresh application form with corrected information."
-            },
-            {
-                "step": "5. Submit Application",
-                "description": "Submit the new application through the portal. You will receive a new confirmation number."
-            }
-        ]
+        if specific_corrections:
+            corrections_needed = [dict(correction) for correction in specific_corrections]
+        else:
+            corrections_needed = self._get_default_corrections(rejection_reason)
         
         # Documents to update based on rejection reason
         documents_to_update = self._get_documents_to_update(rejection_reason)
         
         # Waiting period
-        waiting_period = self.resubmission_rules["default_waiting_period"]
+        waiting_period = _RESUBMISSION_RULES["default_waiting_period"]
         if rejection_reason == RejectionReason.DUPLICATE_APPLICATION:
             waiting_period = 90  # Wait 90 days for duplicate applications
         
-        return ResubmissionGuidance(
+        return ResubmissionGuidance.model_construct(
             application_id=application_id,
             resubmission_allowed=True,
             waiting_period=waiting_period,
             corrections_needed=corrections_needed,
-            resubmission_process=resubmission_process,
+            resubmission_process=[dict(step) for step in _RESUBMISSION_PROCESS_STEPS],
             documents_to_update=documents_to_update,
-            estimated_timeline=self.resubmission_rules["processing_time"],
-            tips=self.resubmission_rules["general_tips"]
+            estimated_timeline=_RESUBMISSION_RULES["processing_time"],
+            tips=list(_RESUBMISSION_RULES["general_tips"])
         )
 
     def _get_default_corrections(self, rejection_reason: RejectionReason) -> List[Dict[str, str]]:
         """Get default corrections needed based on rejection reason"""
-        corrections_map = {
-            RejectionReason.INCOMPLETE_DOCUMENTS: [
-                {
-                    "issue": "Missing Documents",
-                    "correction": "Submit all required documents as per the scheme checklist"
-                }
-            ],
-            RejectionReason.INVALID_INFORMATION: [
-                {
-                    "issue": "Incorrect Information",
-                    "correction": "Verify and correct all information with supporting documents"
-                }
-            ],
-            RejectionReason.MISSING_CRITERIA: [
-                {
-                    "issue": "Eligibility Criteria Not Met",
-                    "correction": "Review eligibility requirements and provide evidence of meeting criteria"
-                }
-            ],
-            RejectionReason.EXPIRED_DOCUMENTS: [
-                {
-                    "issue": "Expired Documents",
-                    "correction": "Obtain fresh, valid copies of all expired documents"
-                }
-            ],
-            RejectionReason.TECHNICAL_ERROR: [
-                {
-                    "issue": "Technical Processing Error",
-                    "correction": "Resubmit the same application - no changes needed"
-                }
-            ]
-        }
-        
-        return corrections_map.get(rejection_reason, [
-            {
-                "issue": "Application Issues",
-                "correction": "Review rejection details and correct all mentioned issues"
-            }
-        ])
+        return [dict(correction) for correction in _DEFAULT_CORRECTIONS.get(rejection_reason, _FALLBACK_CORRECTION)]
 
     def _get_documents_to_update(self, rejection_reason: RejectionReason) -> List[Dict[str, str]]:
         """Get documents that need to be updated based on rejection reason"""
-        if rejection_reason == RejectionReason.EXPIRED_DOCUMENTS:
-            return [
-                {
-                    "document": "All Expired Documents",
-                    "action": "Obtain fresh copies with current validity"
-                }
-            ]
-        elif rejection_reason == RejectionReason.INCOMPLETE_DOCUMENTS:
-            return [
-                {
-                    "document": "Missing Documents",
-                    "action": "Submit all documents from the required checklist"
-                }
-            ]
-        elif rejection_reason == RejectionReason.INVALID_INFORMATION:
-            return [
-                {
-                    "document": "Verification Documents",
-                    "action": "Provide documents that verify the corrected information"
-                }
-            ]
-        else:
-            return []
+        return [dict(document) for document in _DOCUMENTS_TO_UPDATE.get(rejection_reason, ())]
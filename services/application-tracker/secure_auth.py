@@ -6,17 +6,26 @@ Validates: Requirement 9.4 (secure token-based access for government portals)
 """
 
 import os
-import json
-import time
-import hashlib
+import atexit
+import copy
+import mmap
+import queue
+import threading
 import secrets
-import base64
+import weakref
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, BinaryIO, Iterable, Iterator, Tuple
 from enum import Enum
 from pathlib import Path
+import orjson
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+try:
+    # SIMD-accelerated base64 (libbase64); same API as the stdlib functions
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
 
 class AuthMethod(str, Enum):
     """Supported authentication methods"""
@@ -49,12 +58,29 @@ class AuditEventType(str, Enum):
     UNAUTHORIZED_ACCESS = "unauthorized_access"
 
 
+# AES-GCM nonce length in bytes
+_NONCE_SIZE = 12
+
+
 class SimpleEncryption:
     """Simple AES-256-GCM encryption for credentials"""
     
-    def __init__(self, key: Optional[bytes] = None):
-        """Initialize with encryption key"""
+    def __init__(self, key: Optional[bytes] = None, compact: bool = False):
+        """
+        Initialize with encryption key.
+        
+        Args:
+            key: AES-256 key; a new one is generated when omitted
+            compact: Write base64(nonce || ciphertext) with one encode
+                instead of base64(nonce):base64(ciphertext). Releases before
+                this one can only read the colon format, so leave this off
+                until every instance sharing the vault reads both
+        """
         self.key = key or AESGCM.generate_key(bit_length=256)
+        self.compact = compact
+        # One AESGCM per key; OpenSSL's EVP layer picks the AES-NI/CLMUL
+        # GCM implementation. Building a hazmat Cipher per call instead
+        # measured slower than AESGCM.encrypt
         self.cipher = AESGCM(self.key)
     
     def encrypt(self, plaintext: str) -> str:
@@ -62,14 +88,34 @@ class SimpleEncryption:
         if not plaintext:
             return ""
         
-        nonce = os.urandom(12)
+        nonce = os.urandom(_NONCE_SIZE)
         ciphertext = self.cipher.encrypt(nonce, plaintext.encode('utf-8'), None)
         
-        # Format: nonce:ciphertext (both base64)
-        nonce_b64 = base64.b64encode(nonce).decode('utf-8')
-        ciphertext_b64 = base64.b64encode(ciphertext).decode('utf-8')
-        
-        return f"{nonce_b64}:{ciphertext_b64}"
+        if self.compact:
+            # Format: base64(nonce || ciphertext || tag)
+            return b64encode(nonce + ciphertext).decode('ascii')
+        # Format: base64(nonce):base64(ciphertext || tag)
+        return f"{b64encode(nonce).decode('ascii')}:{b64encode(ciphertext).decode('ascii')}"
+    
+    def encrypt_many(self, plaintexts: Iterable[str]) -> List[str]:
+        """Encrypt several values, binding the cipher and helpers once"""
+        encrypt = self.cipher.encrypt
+        urandom = os.urandom
+        compact = self.compact
+        results = []
+        for plaintext in plaintexts:
+            if not plaintext:
+                results.append("")
+                continue
+            nonce = urandom(_NONCE_SIZE)
+            ciphertext = encrypt(nonce, plaintext.encode('utf-8'), None)
+            if compact:
+                results.append(b64encode(nonce + ciphertext).decode('ascii'))
+            else:
+                results.append(
+                    f"{b64encode(nonce).decode('ascii')}:{b64encode(ciphertext).decode('ascii')}"
+                )
+        return results
     
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt encrypted data"""
@@ -77,12 +123,18 @@ class SimpleEncryption:
             return ""
         
         try:
-            parts = encrypted_data.split(':')
-            if len(parts) != 2:
-                raise ValueError("Invalid encrypted data format")
-            
-            nonce = base64.b64decode(parts[0])
-            ciphertext = base64.b64decode(parts[1])
+            if ':' in encrypted_data:
+                # Colon format: base64(nonce):base64(ciphertext || tag).
+                # ':' is outside the base64 alphabet, so compact values
+                # never contain it
+                parts = encrypted_data.split(':')
+                if len(parts) != 2:
+                    raise ValueError("Invalid encrypted data format")
+                nonce = b64decode(parts[0])
+                ciphertext = b64decode(parts[1])
+            else:
+                blob = b64decode(encrypted_data)
+                nonce, ciphertext = blob[:_NONCE_SIZE], blob[_NONCE_SIZE:]
             
             plaintext = self.cipher.decrypt(nonce, ciphertext, None)
             return plaintext.decode('utf-8')
@@ -90,27 +142,46 @@ class SimpleEncryption:
             raise ValueError(f"Decryption failed: {str(e)}")
 
 
+# Credential fields encrypted at rest
+_SENSITIVE_FIELDS = frozenset({
+    'client_secret', 'api_key', 'password', 'secret',
+    'refresh_token', 'access_token', 'private_key'
+})
+
+# Marker key stored next to each encrypted field
+_ENCRYPTED_MARKERS = {field: f"{field}_encrypted" for field in _SENSITIVE_FIELDS}
+
+
 class CredentialVault:
     """
     Secure credential storage using encryption.
     Integrates with encryption service for key management.
     """
     
-    def __init__(self, vault_path: str = "./data/vault"):
+    def __init__(self, vault_path: str = "./data/vault", compact_ciphertext: bool = False):
         """
         Initialize credential vault.
         
         Args:
             vault_path: Directory for storing encrypted credentials
+            compact_ciphertext: Store encrypted fields in the single-blob
+                format (see SimpleEncryption); both formats are always read
         """
         self.vault_path = vault_path
         os.makedirs(vault_path, exist_ok=True)
         
         # Initialize encryption
-        self.encryption = SimpleEncryption()
+        self.compact_ciphertext = compact_ciphertext
+        self.encryption = SimpleEncryption(compact=compact_ciphertext)
         
         # Load credentials
         self.credentials: Dict[str, Dict[str, Any]] = {}
+        # On-disk (encrypted) form of each credential, and a snapshot of the
+        # plaintext it was built from. Saves re-encrypt only credentials that
+        # differ from their snapshot, which includes edits callers made
+        # directly to dicts returned by retrieve_credential
+        self._encrypted: Dict[str, Dict[str, Any]] = {}
+        self._encrypted_from: Dict[str, Dict[str, Any]] = {}
         self._load_credentials()
     
     def _load_credentials(self) -> None:
@@ -121,56 +192,79 @@ class CredentialVault:
             return
         
         try:
-            with open(cred_file, 'r') as f:
-                encrypted_data = json.load(f)
+            with open(cred_file, 'rb') as f:
+                encrypted_data = orjson.loads(f.read())
             
             # Decrypt each credential set
             for portal_id, cred_data in encrypted_data.items():
-                self.credentials[portal_id] = self._decrypt_credential(cred_data)
+                decrypted = self._decrypt_credential(cred_data)
+                self.credentials[portal_id] = decrypted
+                self._encrypted[portal_id] = cred_data
+                self._encrypted_from[portal_id] = copy.deepcopy(decrypted)
         except Exception as e:
             print(f"Error loading credentials: {e}")
     
     def _save_credentials(self) -> None:
-        """Save encrypted credentials to storage"""
+        """Re-encrypt every credential and save to storage"""
+        self._encrypted = {}
+        self._encrypted_from = {}
+        self._save_changed_credentials()
+    
+    def _save_changed_credentials(self) -> None:
+        """Re-encrypt added or changed credentials, drop deleted ones, and save"""
+        credentials = self.credentials
+        encrypted = self._encrypted
+        encrypted_from = self._encrypted_from
+        
+        for portal_id in [p for p in encrypted if p not in credentials]:
+            del encrypted[portal_id]
+            encrypted_from.pop(portal_id, None)
+        
+        for portal_id, cred_data in credentials.items():
+            if encrypted_from.get(portal_id) != cred_data:
+                encrypted[portal_id] = self._encrypt_credential(cred_data)
+                encrypted_from[portal_id] = copy.deepcopy(cred_data)
+        
+        self._write_credentials()
+    
+    def _write_credentials(self) -> None:
+        """Write the encrypted credentials to storage"""
         cred_file = os.path.join(self.vault_path, "credentials.json")
         
-        # Encrypt each credential set
-        encrypted_data = {}
-        for portal_id, cred_data in self.credentials.items():
-            encrypted_data[portal_id] = self._encrypt_credential(cred_data)
-        
-        with open(cred_file, 'w') as f:
-            json.dump(encrypted_data, f, indent=2)
+        with open(cred_file, 'wb') as f:
+            f.write(orjson.dumps(self._encrypted, option=orjson.OPT_INDENT_2))
     
     def _encrypt_credential(self, credential: Dict[str, Any]) -> Dict[str, Any]:
         """Encrypt sensitive credential fields"""
-        sensitive_fields = [
-            'client_secret', 'api_key', 'password', 'secret',
-            'refresh_token', 'access_token', 'private_key'
+        encrypted_data = credential.copy()
+        # Walk the credential's own (few) keys in order rather than probing
+        # it for every sensitive field name
+        fields = [
+            field for field, value in encrypted_data.items()
+            if value and field in _SENSITIVE_FIELDS
         ]
         
-        encrypted_data = credential.copy()
-        for field in sensitive_fields:
-            if field in encrypted_data and encrypted_data[field]:
-                value = str(encrypted_data[field])
-                encrypted_data[field] = self.encryption.encrypt(value)
-                encrypted_data[f"{field}_encrypted"] = True
+        # Each field still gets its own nonce; the batch only shares setup
+        ciphertexts = self.encryption.encrypt_many(
+            str(encrypted_data[field]) for field in fields
+        )
+        for field, ciphertext in zip(fields, ciphertexts):
+            encrypted_data[field] = ciphertext
+            encrypted_data[_ENCRYPTED_MARKERS[field]] = True
         
         return encrypted_data
     
     def _decrypt_credential(self, encrypted_credential: Dict[str, Any]) -> Dict[str, Any]:
         """Decrypt sensitive credential fields"""
-        sensitive_fields = [
-            'client_secret', 'api_key', 'password', 'secret',
-            'refresh_token', 'access_token', 'private_key'
-        ]
-        
         decrypted_data = encrypted_credential.copy()
-        for field in sensitive_fields:
-            if field in decrypted_data and decrypted_data.get(f"{field}_encrypted"):
-                encrypted_value = decrypted_data[field]
-                decrypted_data[field] = self.encryption.decrypt(encrypted_value)
-                decrypted_data.pop(f"{field}_encrypted", None)
+        fields = [
+            field for field in decrypted_data
+            if field in _SENSITIVE_FIELDS
+            and decrypted_data.get(_ENCRYPTED_MARKERS[field])
+        ]
+        for field in fields:
+            decrypted_data[field] = self.encryption.decrypt(decrypted_data[field])
+            del decrypted_data[_ENCRYPTED_MARKERS[field]]
         
         return decrypted_data
     
@@ -191,11 +285,12 @@ class CredentialVault:
         """
         try:
             # Add metadata
-            credential_data['created_at'] = datetime.utcnow().isoformat()
-            credential_data['updated_at'] = datetime.utcnow().isoformat()
+            now = datetime.utcnow().isoformat()
+            credential_data['created_at'] = now
+            credential_data['updated_at'] = now
             
             self.credentials[portal_id] = credential_data
-            self._save_credentials()
+            self._save_changed_credentials()
             return True
         except Exception as e:
             print(f"Error storing credential: {e}")
@@ -234,7 +329,7 @@ class CredentialVault:
         try:
             self.credentials[portal_id].update(updates)
             self.credentials[portal_id]['updated_at'] = datetime.utcnow().isoformat()
-            self._save_credentials()
+            self._save_changed_credentials()
             return True
         except Exception as e:
             print(f"Error updating credential: {e}")
@@ -252,7 +347,7 @@ class CredentialVault:
         """
         if portal_id in self.credentials:
             del self.credentials[portal_id]
-            self._save_credentials()
+            self._save_changed_credentials()
             return True
         return False
     
@@ -265,7 +360,7 @@ class CredentialVault:
         """
         try:
             # Generate new key
-            new_encryption = SimpleEncryption()
+            new_encryption = SimpleEncryption(compact=self.compact_ciphertext)
             
             # Re-encrypt all credentials with new key
             for portal_id, cred_data in self.credentials.items():
@@ -283,20 +378,192 @@ class CredentialVault:
             return False
 
 
+# Caller-supplied details may carry non-string keys, which json.dumps
+# used to coerce to strings
+_AUDIT_DUMPS_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _prefilter_needle(value: Optional[str]) -> Optional[bytes]:
+    """
+    Quoted JSON form of a filter value, for a byte-level prefilter.
+    
+    Only plain printable ASCII serializes identically under json.dumps
+    (older log lines) and orjson, so other values get no prefilter.
+    """
+    if (value and value.isascii() and value.isprintable()
+            and '"' not in value and '\\' not in value):
+        return f'"{value}"'.encode('ascii')
+    return None
+
+
+def _scan_log_lines(log_file: str, needle: Optional[bytes]) -> Iterator[bytes]:
+    """Yield the lines of a log file, only those containing needle if given"""
+    with open(log_file, 'rb') as f:
+        if needle is None:
+            yield from f
+            return
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Jump between needle hits and widen each to its line, so lines
+            # without the needle are never split out or parsed
+            pos = mm.find(needle)
+            while pos != -1:
+                start = mm.rfind(b'\n', 0, pos) + 1
+                end = mm.find(b'\n', pos)
+                if end == -1:
+                    end = len(mm)
+                yield mm[start:end]
+                pos = mm.find(needle, end)
+
+
 class AuditLogger:
     """
     Comprehensive audit logging for all authentication and data access events.
     """
     
-    def __init__(self, log_path: str = "./data/audit"):
+    def __init__(
+        self,
+        log_path: str = "./data/audit",
+        flush_every: int = 1,
+        background: bool = False,
+        max_queued_events: int = 10000
+    ):
         """
         Initialize audit logger.
         
         Args:
             log_path: Directory for storing audit logs
+            flush_every: Events buffered before writing to disk; the default
+                keeps every event on disk as soon as it is logged
+            background: Hand events to a writer thread so log_event never
+                waits on disk; flush() and query_logs() wait for the backlog
+            max_queued_events: Backlog at which log_event stops queueing
+                and writes the event itself rather than waiting or dropping it
         """
         self.log_path = log_path
         os.makedirs(log_path, exist_ok=True)
+        
+        self.flush_every = max(1, flush_every)
+        
+        # The day's log file stays open instead of being reopened per event
+        self._handle: Optional[BinaryIO] = None
+        self._handle_date: Optional[str] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        
+        # (day ordinal, date key) of the last event, so strftime runs once
+        # per day; a single tuple so threads never see a mismatched pair
+        self._day: Tuple[int, str] = (-1, "")
+        
+        # Guards _closed and the hand-off to _queue, so no event can be
+        # queued behind the writer's stop sentinel
+        self._state_lock = threading.Lock()
+        self._closed = False
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=max(1, max_queued_events))
+            self._writer = threading.Thread(
+                target=self._drain, name="audit-writer", daemon=True
+            )
+            self._writer.start()
+        
+        # Closed at interpreter exit through a weak reference, so the
+        # atexit registry does not keep every logger alive
+        self_ref = weakref.ref(self)
+        
+        def close_at_exit() -> None:
+            logger = self_ref()
+            if logger is not None:
+                logger.close()
+        
+        self._atexit_hook = close_at_exit
+        atexit.register(close_at_exit)
+    
+    def _get_handle(self, date_key: str) -> BinaryIO:
+        """Return the open log file for date_key, rotating at day change"""
+        if self._handle_date != date_key:
+            if self._handle is not None:
+                self._handle.close()
+            self._handle = None
+            log_file = os.path.join(self.log_path, f"audit_{date_key}.jsonl")
+            self._handle = open(log_file, 'ab', buffering=65536)
+            self._handle_date = date_key
+        return self._handle
+    
+    def _write(self, date_key: str, line: bytes, force_flush: bool = False) -> None:
+        """Append one serialized event, flushing every flush_every events"""
+        with self._lock:
+            handle = self._get_handle(date_key)
+            handle.write(line)
+            self._pending += 1
+            if force_flush or self._pending >= self.flush_every:
+                handle.flush()
+                self._pending = 0
+    
+    def _drain(self) -> None:
+        """Writer thread: write queued events in batches until closed"""
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < 1024:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            for index, item in enumerate(batch):
+                if item is None:
+                    stop = True
+                    continue
+                date_key, line = item
+                try:
+                    self._write(date_key, line, force_flush=index == len(batch) - 1)
+                except Exception as e:
+                    print(f"Error writing audit log: {e}")
+            for _ in batch:
+                q.task_done()
+            if stop:
+                return
+    
+    def flush(self) -> None:
+        """Write any buffered events to disk"""
+        if self._queue is not None:
+            self._queue.join()
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+            self._pending = 0
+    
+    def close(self) -> None:
+        """Flush and close the open log file"""
+        with self._state_lock:
+            self._closed = True
+            q, self._queue = self._queue, None
+        if q is not None:
+            q.put(None)
+            self._writer.join()
+        atexit.unregister(self._atexit_hook)
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._handle_date = None
+            self._pending = 0
+    
+    def _write_after_close(self, date_key: str, line: bytes) -> None:
+        """Append one event for a closed logger without leaving the file open"""
+        with self._lock:
+            handle = self._get_handle(date_key)
+            try:
+                handle.write(line)
+            finally:
+                handle.close()
+                self._handle = None
+                self._handle_date = None
+                self._pending = 0
     
     def log_event(
         self,
@@ -334,15 +601,31 @@ class AuditLogger:
             'details': details or {}
         }
         
-        # Write to daily log file
-        log_file = os.path.join(
-            self.log_path,
-            f"audit_{timestamp.strftime('%Y%m%d')}.jsonl"
-        )
+        # Serialized here so later changes to details cannot race the writer
+        day_ordinal = timestamp.toordinal()
+        cached_ordinal, date_key = self._day
+        if day_ordinal != cached_ordinal:
+            date_key = timestamp.strftime('%Y%m%d')
+            self._day = (day_ordinal, date_key)
+        line = orjson.dumps(audit_entry, option=_AUDIT_DUMPS_OPTIONS)
+        
+        with self._state_lock:
+            closed = self._closed
+            q = self._queue
+            if q is not None:
+                try:
+                    q.put_nowait((date_key, line))
+                    return
+                except queue.Full:
+                    # Writer is behind; write this event here instead
+                    pass
         
+        # Write to daily log file
         try:
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(audit_entry) + '\n')
+            if closed:
+                self._write_after_close(date_key, line)
+            else:
+                self._write(date_key, line)
         except Exception as e:
             print(f"Error writing audit log: {e}")
     
@@ -369,29 +652,40 @@ class AuditLogger:
         """
         results = []
         
+        # Buffered events must be visible to the reads below
+        self.flush()
+        
+        # Most selective filter first; matches are re-checked after parsing
+        needle = (
+            _prefilter_needle(user_id)
+            or _prefilter_needle(portal_id)
+            or (_prefilter_needle(event_type.value) if event_type else None)
+        )
+        
+        # One directory listing instead of an exists() call per day
+        with os.scandir(self.log_path) as entries:
+            available = {entry.name for entry in entries}
+        
         # Iterate through date range
         current_date = start_date
         while current_date <= end_date:
-            log_file = os.path.join(
-                self.log_path,
-                f"audit_{current_date.strftime('%Y%m%d')}.jsonl"
-            )
+            log_name = f"audit_{current_date.strftime('%Y%m%d')}.jsonl"
             
-            if os.path.exists(log_file):
+            if log_name in available:
+                log_file = os.path.join(self.log_path, log_name)
                 try:
-                    with open(log_file, 'r') as f:
-                        for line in f:
-                            entry = json.loads(line)
-                            
-                            # Apply filters
-                            if event_type and entry['event_type'] != event_type.value:
-                                continue
-                            if user_id and entry['user_id'] != user_id:
-                                continue
-                            if portal_id and entry['portal_id'] != portal_id:
-                                continue
-                            
-                            results.append(entry)
+                    for line in _scan_log_lines(log_file, needle):
+                        entry = orjson.loads(line)
+                        
+                        # Apply filters
+                        if event_type and entry['event_type'] != event_type.value:
+                            continue
+                        if user_id and entry['user_id'] != user_id:
+                            continue
+                        if portal_id and entry['portal_id'] != portal_id:
+                            continue
+                        
+                        results.append(entry)
                 except Exception as e:
                     print(f"Error reading log file {log_file}: {e}")
             
@@ -400,9 +694,15 @@ class AuditLogger:
         return results
 
 
+_STATUS_REVOKED = SessionStatus.REVOKED.value
+
+
 class SessionManager:
     """
     Session management with timeout policies and security controls.
+    
+    Session timestamps (created_at, last_activity, expires_at) are naive
+    UTC datetimes; session dicts are returned to callers as-is.
     """
     
     def __init__(
@@ -438,9 +738,10 @@ class SessionManager:
         Returns:
             Session ID
         """
-        session_id = self._generate_session_id(user_id, portal_id)
+        session_id = self._generate_session_id()
         
         now = datetime.utcnow()
+        expires_at = now + timedelta(minutes=self.session_timeout_minutes)
         self.sessions[session_id] = {
             'session_id': session_id,
             'user_id': user_id,
@@ -448,17 +749,17 @@ class SessionManager:
             'auth_data': auth_data,
             'created_at': now,
             'last_activity': now,
-            'expires_at': now + timedelta(minutes=self.session_timeout_minutes),
+            'expires_at': expires_at,
             'status': SessionStatus.ACTIVE.value
         }
         
         return session_id
     
-    def _generate_session_id(self, user_id: str, portal_id: str) -> str:
+    def _generate_session_id(self) -> str:
         """Generate a secure session ID"""
-        random_bytes = secrets.token_bytes(32)
-        data = f"{user_id}:{portal_id}:{time.time()}:{random_bytes.hex()}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        # 256 random bits; hashing them with the user, portal and time added
+        # no entropy, and those are stored on the session itself
+        return secrets.token_hex(32)
     
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -472,37 +773,28 @@ class SessionManager:
         """
         session = self.sessions.get(session_id)
         
-        if not session:
+        # Check if session is missing or revoked
+        if session is None or session['status'] == _STATUS_REVOKED:
             return None
         
-        # Check if session is revoked
-        if session['status'] == SessionStatus.REVOKED.value:
-            return None
+        # Expiry and idle checks inlined against a single clock read
+        now = datetime.utcnow()
         
         # Check if session is expired
-        if self._is_session_expired(session):
+        if now > session['expires_at']:
             self._expire_session(session_id)
             return None
         
         # Check idle timeout
-        if self._is_session_idle(session):
+        if now - session['last_activity'] > timedelta(minutes=self.max_idle_minutes):
             self._timeout_session(session_id)
             return None
         
         # Update last activity
-        session['last_activity'] = datetime.utcnow()
+        session['last_activity'] = now
         
         return session
     
-    def _is_session_expired(self, session: Dict[str, Any]) -> bool:
-        """Check if session has expired"""
-        return datetime.utcnow() > session['expires_at']
-    
-    def _is_session_idle(self, session: Dict[str, Any]) -> bool:
-        """Check if session has been idle too long"""
-        idle_time = datetime.utcnow() - session['last_activity']
-        return idle_time.total_seconds() > (self.max_idle_minutes * 60)
-    
     def _expire_session(self, session_id: str) -> None:
         """Mark session as expired"""
         if session_id in self.sessions:
@@ -544,10 +836,10 @@ class SessionManager:
             return False
         
         # Extend expiration
-        session['expires_at'] = datetime.utcnow() + timedelta(
-            minutes=self.session_timeout_minutes
-        )
-        session['last_activity'] = datetime.utcnow()
+        now = datetime.utcnow()
+        expires_at = now + timedelta(minutes=self.session_timeout_minutes)
+        session['expires_at'] = expires_at
+        session['last_activity'] = now
         
         return True
     
@@ -558,12 +850,15 @@ class SessionManager:
         Returns:
             Number of sessions cleaned up
         """
-        expired_sessions = []
-        
-        for session_id, session in self.sessions.items():
-            if (session['status'] != SessionStatus.ACTIVE.value or
-                self._is_session_expired(session)):
-                expired_sessions.append(session_id)
+        # Session dicts are handed out by get_session and may be changed
+        # in place, so every session's live status and expiry is checked
+        now = datetime.utcnow()
+        active = SessionStatus.ACTIVE.value
+        expired_sessions = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if session['status'] != active or now > session['expires_at']
+        ]
         
         for session_id in expired_sessions:
             del self.sessions[session_id]
@@ -460,3 +460,52 @@ class TestEndToEndFlow:
         status_data = status_response.json()
         assert status_data["application_id"] == application_id
         assert "status" in status_data
+
+
+class TestInputSanitization:
+    """Test input sanitization helper"""
+
+    def test_sanitize_strips_tags(self):
+        """Test that HTML tags are removed"""
+        from main import sanitize_string
+        
+        assert sanitize_string("<b>APP-1</b>") == "APP-1"
+        assert sanitize_string("a<script>x</script>b") == "axb"
+
+    def test_sanitize_keeps_non_tags(self):
+        """Test that brackets that do not form tags are kept"""
+        from main import sanitize_string
+        
+        assert sanitize_string("a <> b") == "a <> b"
+        assert sanitize_string("1 < 2") == "1 < 2"
+        assert sanitize_string("<<<x") == "<<<x"
+
+    def test_sanitize_limits_length(self):
+        """Test that output is truncated"""
+        from main import sanitize_string
+        
+        assert len(sanitize_string("x" * 20000)) == 10000
+
+
+class TestUnhandledErrors:
+    """Test the generic 500 response for unexpected endpoint errors"""
+
+    def test_unexpected_error_returns_500_with_cors_headers(self, client, monkeypatch, caplog):
+        """Test that unexpected errors keep CORS headers and are logged once"""
+        import main
+        
+        async def failing_get_timeline(application_id):
+            raise RuntimeError("storage unavailable")
+        
+        monkeypatch.setattr(main, "_get_timeline", failing_get_timeline)
+        
+        with caplog.at_level("ERROR"):
+            response = client.get(
+                "/application/APP-1/timeline",
+                headers={"Origin": "https://example.org"}
+            )
+        
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+        assert "access-control-allow-origin" in response.headers
+        assert len([r for r in caplog.records if "storage unavailable" in r.getMessage()]) == 1
@@ -221,6 +221,33 @@ class TestStatusWithNotifications:
         assert "confirmation_number" in data["timeline"]
         assert "expected_completion" in data["timeline"]
 
+    def test_status_check_queues_status_notification(self, client, sample_application_data, sample_credentials):
+        """Test status notification is delivered after the status response"""
+        submit_response = client.post(
+            "/application/submit",
+            json={
+                "portal_type": "myscheme",
+                "application_data": sample_application_data,
+                "credentials": sample_credentials
+            }
+        )
+        
+        application_id = submit_response.json()["application_id"]
+        
+        response = client.post(
+            "/application/status",
+            json={
+                "portal_type": "myscheme",
+                "application_id": application_id,
+                "credentials": sample_credentials
+            }
+        )
+        assert response.status_code == 200
+        
+        notifications = client.get(f"/application/{application_id}/notifications").json()
+        types = [n["type"] for n in notifications["notifications"]]
+        assert "status_update" in types
+
 
 class TestNotificationEndpoints:
     """Test notification management endpoints"""
@@ -189,6 +189,27 @@ class TestTimelineRetrieval:
         ]
         assert len(timeline_notifications) > 0
 
+    @pytest.mark.asyncio
+    async def test_update_timeline_keeps_header(self, lifecycle_manager, sample_application):
+        """Test that updates only touch the mutable progress of a timeline"""
+        created_timeline = await lifecycle_manager.create_timeline(
+            confirmation_number=sample_application["confirmation_number"],
+            application_id=sample_application["application_id"],
+            portal_type=sample_application["portal_type"]
+        )
+        header = created_timeline.header
+        
+        updated_timeline = await lifecycle_manager.update_timeline(
+            application_id=sample_application["application_id"],
+            current_stage="acknowledgment",
+            new_expected_completion=created_timeline.expected_completion + timedelta(days=3)
+        )
+        
+        assert updated_timeline.header is header
+        assert updated_timeline.submitted_at == header.submitted_at
+        with pytest.raises(AttributeError):
+            header.confirmation_number = "CHANGED"
+
 
 class TestNotifications:
     """Test notification system"""
@@ -318,6 +339,39 @@ class TestNotifications:
         assert marked_notification.read is True
 
 
+    @pytest.mark.asyncio
+    async def test_notification_history_is_bounded(self, sample_application):
+        """Test that only the most recent notifications are retained"""
+        manager = LifecycleManager(max_notifications_per_application=3)
+        
+        for i in range(5):
+            await manager.send_status_notification(
+                application_id=sample_application["application_id"],
+                status="submitted",
+                status_description=f"Update {i}",
+                next_steps=[]
+            )
+        
+        notifications = await manager.get_notifications(sample_application["application_id"])
+        assert [n.message.split("\n")[0] for n in notifications] == ["Update 2", "Update 3", "Update 4"]
+        
+        unread = await manager.get_notifications(
+            sample_application["application_id"],
+            unread_only=True
+        )
+        assert len(unread) == 3
+        
+        for notification in notifications:
+            await manager.mark_notification_read(
+                sample_application["application_id"],
+                notification.notification_id
+            )
+        
+        assert await manager.get_notifications(
+            sample_application["application_id"],
+            unread_only=True
+        ) == []
+
 class TestAdditionalInfoRequests:
     """Test additional information request handling"""
 
@@ -473,6 +527,23 @@ class TestAdditionalInfoRequests:
                 submitted_data={"data": "value"}
             )
 
+    @pytest.mark.asyncio
+    async def test_submit_additional_info_wrong_application(self, lifecycle_manager, sample_application):
+        """Test that a request cannot be answered through another application"""
+        request = await lifecycle_manager.create_additional_info_request(
+            application_id=sample_application["application_id"],
+            required_items=[{"name": "Document", "description": "Required"}]
+        )
+        
+        with pytest.raises(ValueError, match="not found"):
+            await lifecycle_manager.submit_additional_info(
+                request_id=request.request_id,
+                application_id="OTHER-APPLICATION",
+                submitted_data={"data": "value"}
+            )
+        
+        assert request.status == "pending"
+
     @pytest.mark.asyncio
     async def test_submit_additional_info_already_submitted(self, lifecycle_manager, sample_application):
         """Test submitting info for already submitted request raises error"""
@@ -588,3 +659,227 @@ class TestNotificationSubscription:
         
         # Callback should not be called
         assert len(received_notifications) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_subscribers_notified_concurrently(self, lifecycle_manager, sample_application):
+        """Test that async subscribers are awaited concurrently and failures are isolated"""
+        import asyncio
+        
+        started = []
+        release = asyncio.Event()
+        
+        async def slow_callback(notification):
+            started.append("slow")
+            await release.wait()
+        
+        async def failing_callback(notification):
+            started.append("failing")
+            raise RuntimeError("subscriber failure")
+        
+        async def releasing_callback(notification):
+            started.append("releasing")
+            release.set()
+        
+        for callback in (slow_callback, failing_callback, releasing_callback):
+            lifecycle_manager.subscribe_to_notifications(
+                sample_application["application_id"],
+                callback
+            )
+        
+        # Would deadlock if subscribers were awaited one after another
+        notification = await asyncio.wait_for(
+            lifecycle_manager.send_status_notification(
+                application_id=sample_application["application_id"],
+                status="submitted",
+                status_description="Submitted",
+                next_steps=[]
+            ),
+            timeout=1.0
+        )
+        
+        assert notification is not None
+        assert sorted(started) == ["failing", "releasing", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_burst_notifications_delivered_in_order(self, lifecycle_manager, sample_application):
+        """Test that notifications sent during a delivery are drained in order"""
+        import asyncio
+        
+        received = []
+        
+        async def callback(notification):
+            await asyncio.sleep(0)
+            received.append(notification.title)
+        
+        lifecycle_manager.subscribe_to_notifications(
+            sample_application["application_id"],
+            callback
+        )
+        
+        await asyncio.gather(*[
+            lifecycle_manager.send_status_notification(
+                application_id=sample_application["application_id"],
+                status=status,
+                status_description=status,
+                next_steps=[]
+            )
+            for status in ("submitted", "under_review", "processing")
+        ])
+        
+        assert received == [
+            "Status Update: Submitted",
+            "Status Update: Under Review",
+            "Status Update: Processing"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_drain_hands_off_queued_notifications(self, lifecycle_manager, sample_application):
+        """Test that cancelling the draining sender does not drop later notifications"""
+        import asyncio
+        
+        received = []
+        release = asyncio.Event()
+        
+        async def callback(notification):
+            if not received:
+                received.append(notification.title)
+                await release.wait()
+            else:
+                received.append(notification.title)
+        
+        lifecycle_manager.subscribe_to_notifications(
+            sample_application["application_id"],
+            callback
+        )
+        
+        first = asyncio.ensure_future(lifecycle_manager.send_status_notification(
+            application_id=sample_application["application_id"],
+            status="submitted",
+            status_description="submitted",
+            next_steps=[]
+        ))
+        while not received:
+            await asyncio.sleep(0)
+        
+        # Queued behind the blocked delivery; returns without draining
+        await lifecycle_manager.send_status_notification(
+            application_id=sample_application["application_id"],
+            status="processing",
+            status_description="processing",
+            next_steps=[]
+        )
+        
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.gather(*lifecycle_manager._drain_tasks)
+        
+        assert received == ["Status Update: Submitted", "Status Update: Processing"]
+        
+        await lifecycle_manager.send_status_notification(
+            application_id=sample_application["application_id"],
+            status="approved",
+            status_description="approved",
+            next_steps=[]
+        )
+        assert received[-1] == "Status Update: Approved"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_subscription_notified_once(self, lifecycle_manager, sample_application):
+        """Test that subscribing the same callback twice delivers once"""
+        received_notifications = []
+        
+        def callback(notification):
+            received_notifications.append(notification)
+        
+        lifecycle_manager.subscribe_to_notifications(
+            sample_application["application_id"],
+            callback
+        )
+        lifecycle_manager.subscribe_to_notifications(
+            sample_application["application_id"],
+            callback
+        )
+        
+        await lifecycle_manager.send_status_notification(
+            application_id=sample_application["application_id"],
+            status="submitted",
+            status_description="Submitted",
+            next_steps=[]
+        )
+        
+        assert len(received_notifications) == 1
+
+
+class TestStorageBounds:
+    """Test that per-application storage stays bounded"""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_application_evicted(self):
+        """Test that stores evict the least recently used application"""
+        manager = LifecycleManager(max_applications=2)
+        
+        for app_id in ("APP-1", "APP-2"):
+            await manager.create_timeline(
+                confirmation_number=f"CONF-{app_id}",
+                application_id=app_id,
+                portal_type="myscheme"
+            )
+        
+        # Touch APP-1 so APP-2 becomes the least recently used
+        assert await manager.get_timeline("APP-1") is not None
+        
+        await manager.create_timeline(
+            confirmation_number="CONF-APP-3",
+            application_id="APP-3",
+            portal_type="myscheme"
+        )
+        
+        assert await manager.get_timeline("APP-2") is None
+        assert await manager.get_timeline("APP-1") is not None
+        assert await manager.get_timeline("APP-3") is not None
+        assert len(manager.notifications) <= 2
+
+    @pytest.mark.asyncio
+    async def test_evicted_info_requests_removed_from_index(self):
+        """Test that evicting an application drops its request index entries"""
+        manager = LifecycleManager(max_applications=1)
+        
+        request = await manager.create_additional_info_request(
+            application_id="APP-1",
+            required_items=[{"name": "Document", "description": "Required"}]
+        )
+        await manager.create_additional_info_request(
+            application_id="APP-2",
+            required_items=[{"name": "Document", "description": "Required"}]
+        )
+        
+        with pytest.raises(ValueError, match="not found"):
+            await manager.submit_additional_info(
+                request_id=request.request_id,
+                application_id="APP-1",
+                submitted_data={}
+            )
+
+    @pytest.mark.asyncio
+    async def test_delivery_and_subscriber_tables_bounded(self):
+        """Test that delivery queues and subscriber entries do not accumulate"""
+        manager = LifecycleManager(max_applications=2)
+        
+        def callback(notification):
+            pass
+        
+        for app_id in ("APP-1", "APP-2", "APP-3"):
+            manager.subscribe_to_notifications(app_id, callback)
+            await manager.send_status_notification(
+                application_id=app_id,
+                status="submitted",
+                status_description="Submitted",
+                next_steps=[]
+            )
+        
+        assert manager._pending_delivery == {}
+        assert list(manager.notification_subscribers) == ["APP-2", "APP-3"]
+        
+        manager.unsubscribe_from_notifications("APP-3", callback)
+        assert "APP-3" not in manager.notification_subscribers
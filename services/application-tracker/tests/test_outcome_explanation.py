@@ -240,6 +240,37 @@ class TestRejectionExplanations:
         assert "resubmit" in next_steps_text or "correct" in next_steps_text
 
 
+class TestBatchExplanations:
+    """Test batch outcome explanation generation"""
+
+    def test_batch_preserves_order_and_shares_date(self, outcome_system):
+        """Test that batch results follow input order with one outcome date"""
+        explanations = outcome_system.generate_outcome_explanations_batch([
+            {"application_id": "APP-1", "outcome_type": OutcomeType.APPROVED},
+            {
+                "application_id": "APP-2",
+                "outcome_type": OutcomeType.REJECTED,
+                "rejection_reason": RejectionReason.DUPLICATE_APPLICATION
+            },
+            {"application_id": "APP-3", "outcome_type": OutcomeType.PARTIALLY_APPROVED}
+        ])
+        
+        assert [e.application_id for e in explanations] == ["APP-1", "APP-2", "APP-3"]
+        assert [e.outcome_type for e in explanations] == [
+            OutcomeType.APPROVED,
+            OutcomeType.REJECTED,
+            OutcomeType.PARTIALLY_APPROVED
+        ]
+        assert len({e.outcome_date for e in explanations}) == 1
+        assert explanations[1].primary_reason == outcome_system.rejection_templates[
+            RejectionReason.DUPLICATE_APPLICATION
+        ]["primary"]
+
+    def test_empty_batch(self, outcome_system):
+        """Test that an empty batch yields no explanations"""
+        assert outcome_system.generate_outcome_explanations_batch([]) == []
+
+
 class TestPartialApprovalExplanations:
     """Test partial approval outcome explanations"""
 
@@ -369,6 +400,28 @@ class TestAppealGuidance:
             assert "method" in method
             assert "description" in method
 
+    def test_appeal_documents_not_shared_between_guidances(self, outcome_system, sample_application_id):
+        """Test that each appeal guidance gets its own documents and methods"""
+        first = outcome_system.generate_appeal_guidance(
+            application_id=sample_application_id,
+            rejection_date=datetime.now(),
+            rejection_reason=RejectionReason.INELIGIBLE
+        )
+        first.required_documents[0]["name"] = "changed"
+        first.appeal_process[0]["description"] = "changed"
+        first.submission_methods.append({"method": "Fax", "description": "changed"})
+
+        second = outcome_system.generate_appeal_guidance(
+            application_id=sample_application_id,
+            rejection_date=datetime.now(),
+            rejection_reason=RejectionReason.INELIGIBLE
+        )
+
+        assert isinstance(second.required_documents, list)
+        assert second.required_documents[0]["name"] != "changed"
+        assert second.appeal_process[0]["description"] != "changed"
+        assert len(second.submission_methods) == len(outcome_system.appeal_rules["submission_methods"])
+
     def test_appeal_contact_info_provided(self, outcome_system, sample_application_id):
         """Test that contact information is provided"""
         rejection_date = datetime.now()
@@ -511,6 +564,28 @@ class TestResubmissionGuidance:
         assert guidance.estimated_timeline is not None
         assert len(guidance.estimated_timeline) > 0
 
+    def test_resubmission_guidance_does_not_share_state(self, outcome_system, sample_application_id):
+        """Test that mutating one guidance leaves the next one and the rules untouched"""
+        first = outcome_system.generate_resubmission_guidance(
+            application_id=sample_application_id,
+            rejection_reason=RejectionReason.EXPIRED_DOCUMENTS
+        )
+        first.tips.append("extra tip")
+        first.corrections_needed[0]["issue"] = "changed"
+        first.documents_to_update[0]["action"] = "changed"
+        first.resubmission_process[0]["description"] = "changed"
+
+        second = outcome_system.generate_resubmission_guidance(
+            application_id=sample_application_id,
+            rejection_reason=RejectionReason.EXPIRED_DOCUMENTS
+        )
+
+        assert "extra tip" not in second.tips
+        assert "extra tip" not in outcome_system.resubmission_rules["general_tips"]
+        assert second.corrections_needed[0]["issue"] != "changed"
+        assert second.documents_to_update[0]["action"] != "changed"
+        assert second.resubmission_process[0]["description"] != "changed"
+
 
 class TestRejectionTemplates:
     """Test rejection reason templates"""
@@ -573,6 +648,16 @@ class TestResubmissionRules:
         assert len(rules["general_tips"]) > 0
 
 
+    def test_rules_and_templates_are_read_only(self, outcome_system):
+        """Test that the shared tables cannot be changed through an instance"""
+        with pytest.raises(TypeError):
+            outcome_system.resubmission_rules["processing_time"] = "1 day"
+        with pytest.raises(TypeError):
+            outcome_system.appeal_rules["appeal_window_days"] = 1
+        with pytest.raises(TypeError):
+            outcome_system.rejection_templates[RejectionReason.OTHER]["primary"] = "changed"
+
+
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
@@ -622,3 +707,73 @@ class TestEdgeCases:
         
         # Should work without error
         assert explanation.outcome_type == OutcomeType.REJECTED
+
+
+class TestSerialization:
+    """Test JSON serialization of outcome models"""
+
+    def test_to_json_round_trips(self, outcome_system, sample_application_id):
+        """Test that to_json emits bytes matching the model and omits None fields"""
+        import orjson
+
+        explanation = outcome_system.generate_outcome_explanation(
+            application_id=sample_application_id,
+            outcome_type=OutcomeType.APPROVED
+        )
+        
+        payload = explanation.to_json()
+        data = orjson.loads(payload)
+        
+        assert isinstance(payload, bytes)
+        assert data["application_id"] == sample_application_id
+        assert data["outcome_type"] == "approved"
+        assert data["next_steps"] == explanation.next_steps
+        assert "appeal_deadline" not in data
+        assert OutcomeExplanation.model_validate_json(payload) == explanation
+
+    def test_to_dict_is_json_native(self, outcome_system, sample_application_id):
+        """Test that to_dict emits JSON-native values matching to_json"""
+        import orjson
+
+        explanation = outcome_system.generate_outcome_explanation(
+            application_id=sample_application_id,
+            outcome_type=OutcomeType.REJECTED,
+            rejection_reason=RejectionReason.INCOMPLETE_DOCUMENTS
+        )
+        
+        data = explanation.to_dict()
+        
+        assert isinstance(data["outcome_date"], str)
+        assert isinstance(data["appeal_deadline"], str)
+        assert data == orjson.loads(explanation.to_json())
+
+    @pytest.mark.filterwarnings("error")
+    @pytest.mark.parametrize("rejection_reason, days_ago", [
+        (RejectionReason.DUPLICATE_APPLICATION, 0),
+        (RejectionReason.INCOMPLETE_DOCUMENTS, 60)
+    ])
+    def test_early_return_appeal_guidance_serializes_cleanly(
+        self, outcome_system, sample_application_id, rejection_reason, days_ago
+    ):
+        """Test that not-eligible and expired appeal guidance serialize without warnings"""
+        import orjson
+
+        guidance = outcome_system.generate_appeal_guidance(
+            application_id=sample_application_id,
+            rejection_date=datetime.now() - timedelta(days=days_ago),
+            rejection_reason=rejection_reason
+        )
+        
+        assert guidance.eligibility != AppealEligibility.ELIGIBLE
+        data = guidance.to_dict()
+        assert data["required_documents"] == []
+        assert data["submission_methods"] == []
+        assert data == orjson.loads(guidance.to_json())
+
+    def test_format_date_matches_strftime(self):
+        """Test that the shared date formatter matches strftime for dates and datetimes"""
+        from datetime import date
+        from outcome_explanation import _format_date
+
+        for value in (date(2026, 1, 5), datetime(2025, 12, 31, 23, 59)):
+            assert _format_date(value) == value.strftime('%d %B %Y')
@@ -10,6 +10,8 @@ import os
 import json
 import tempfile
 import shutil
+import gc
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,6 +21,7 @@ sys.path.append('..')
 
 from secure_auth import (
     CredentialVault,
+    SimpleEncryption,
     AuditLogger,
     SessionManager,
     AuthMethod,
@@ -141,6 +144,70 @@ class TestCredentialVault:
         assert retrieved['client_secret'] == 'secret_value'
 
 
+    def test_decrypts_earlier_colon_format(self, vault):
+        """Test that values stored as base64(nonce):base64(ciphertext) still decrypt"""
+        import base64
+        
+        nonce = os.urandom(12)
+        ciphertext = vault.encryption.cipher.encrypt(nonce, b'legacy_secret', None)
+        legacy = f"{base64.b64encode(nonce).decode()}:{base64.b64encode(ciphertext).decode()}"
+        
+        assert vault.encryption.decrypt(legacy) == 'legacy_secret'
+        # Still written by default so older releases can read the vault
+        assert ':' in vault.encryption.encrypt('new_secret')
+    
+    def test_compact_ciphertext_is_opt_in(self, temp_vault_path):
+        """Test that the compact format round-trips and reads colon values"""
+        vault = CredentialVault(vault_path=temp_vault_path, compact_ciphertext=True)
+        vault.store_credential("portal_a", {'api_key': 'key_a'})
+        assert ':' not in vault._encrypted["portal_a"]['api_key']
+        assert vault.retrieve_credential("portal_a")['api_key'] == 'key_a'
+        
+        encrypted = vault.encryption.encrypt('new_secret')
+        assert ':' not in encrypted
+        assert vault.encryption.decrypt(encrypted) == 'new_secret'
+        
+        colon_format = SimpleEncryption(key=vault.encryption.key).encrypt('old_secret')
+        assert vault.encryption.decrypt(colon_format) == 'old_secret'
+    
+    def test_update_reencrypts_only_changed_credential(self, vault, temp_vault_path):
+        """Test that saving one credential leaves the others' ciphertext alone"""
+        vault.store_credential("portal_a", {'api_key': 'key_a'})
+        vault.store_credential("portal_b", {'api_key': 'key_b'})
+        
+        cred_file = os.path.join(temp_vault_path, "credentials.json")
+        with open(cred_file, 'r') as f:
+            before = json.load(f)
+        
+        vault.update_credential("portal_b", {'api_key': 'key_b2'})
+        
+        with open(cred_file, 'r') as f:
+            after = json.load(f)
+        
+        assert after["portal_a"]["api_key"] == before["portal_a"]["api_key"]
+        assert after["portal_b"]["api_key"] != before["portal_b"]["api_key"]
+        assert vault.retrieve_credential("portal_b")['api_key'] == 'key_b2'
+        
+        vault.delete_credential("portal_a")
+        with open(cred_file, 'r') as f:
+            assert list(json.load(f)) == ["portal_b"]
+    
+    def test_in_place_edits_persisted_on_next_save(self, vault, temp_vault_path):
+        """Test that edits to a retrieved credential dict reach disk on the next save"""
+        vault.store_credential("portal_a", {'api_key': 'key_a'})
+        vault.store_credential("portal_b", {'api_key': 'key_b'})
+        
+        vault.retrieve_credential("portal_a")['api_key'] = 'key_a2'
+        vault.update_credential("portal_b", {'api_key': 'key_b2'})
+        
+        cred_file = os.path.join(temp_vault_path, "credentials.json")
+        with open(cred_file, 'r') as f:
+            on_disk = json.load(f)
+        
+        assert vault._decrypt_credential(on_disk["portal_a"])['api_key'] == 'key_a2'
+        assert vault._decrypt_credential(on_disk["portal_b"])['api_key'] == 'key_b2'
+
+
 class TestAuditLogger:
     """Test audit logging functionality"""
     
@@ -254,6 +321,103 @@ class TestAuditLogger:
         assert logs[0]['portal_id'] == 'portal1'
 
 
+    def test_buffered_events_visible_to_query(self, temp_log_path):
+        """Test that buffered events reach disk on query and flush"""
+        logger = AuditLogger(log_path=temp_log_path, flush_every=100)
+        
+        for user in ("user1", "user2"):
+            logger.log_event(
+                event_type=AuditEventType.DATA_ACCESS,
+                user_id=user,
+                portal_id="portal1"
+            )
+        
+        logs = logger.query_logs(
+            start_date=datetime.utcnow() - timedelta(days=1),
+            end_date=datetime.utcnow() + timedelta(days=1)
+        )
+        assert [entry['user_id'] for entry in logs] == ["user1", "user2"]
+        
+        logger.log_event(event_type=AuditEventType.DATA_ACCESS, user_id="user3")
+        logger.close()
+        
+        today = datetime.utcnow().strftime('%Y%m%d')
+        with open(os.path.join(temp_log_path, f"audit_{today}.jsonl"), 'r') as f:
+            assert len(f.readlines()) == 3
+
+
+    def test_background_writer(self, temp_log_path):
+        """Test that events logged through the writer thread reach disk"""
+        logger = AuditLogger(log_path=temp_log_path, background=True)
+        
+        for i in range(50):
+            logger.log_event(event_type=AuditEventType.DATA_ACCESS, user_id=f"user{i}")
+        
+        logs = logger.query_logs(
+            start_date=datetime.utcnow() - timedelta(days=1),
+            end_date=datetime.utcnow() + timedelta(days=1)
+        )
+        assert [entry['user_id'] for entry in logs] == [f"user{i}" for i in range(50)]
+        
+        logger.close()
+        logger.log_event(event_type=AuditEventType.DATA_ACCESS, user_id="late")
+        logs = logger.query_logs(
+            start_date=datetime.utcnow() - timedelta(days=1),
+            end_date=datetime.utcnow() + timedelta(days=1),
+            user_id="late"
+        )
+        assert len(logs) == 1
+        assert logger._handle is None
+
+    def test_unclosed_logger_can_be_collected(self, temp_log_path):
+        """Test that the exit hook does not keep an unclosed logger alive"""
+        logger = AuditLogger(log_path=temp_log_path)
+        logger.log_event(event_type=AuditEventType.DATA_ACCESS, user_id="user1")
+        logger_ref = weakref.ref(logger)
+
+        del logger
+        gc.collect()
+
+        assert logger_ref() is None
+
+    def test_query_logs_reads_older_json_lines(self, logger, temp_log_path):
+        """Test that filtered queries still match lines written by json.dumps"""
+        today = datetime.utcnow().strftime('%Y%m%d')
+        legacy = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'event_type': 'data_access',
+            'user_id': 'user1',
+            'portal_id': 'portal1',
+            'session_id': None,
+            'success': True,
+            'ip_address': None,
+            'details': {}
+        }
+        with open(os.path.join(temp_log_path, f"audit_{today}.jsonl"), 'w') as f:
+            f.write(json.dumps(legacy) + '\n')
+            f.write(json.dumps({**legacy, 'user_id': 'user10'}) + '\n')
+            f.write(json.dumps({**legacy, 'user_id': 'us\u00e9r'}) + '\n')
+        
+        logger.log_event(
+            event_type=AuditEventType.AUTH_SUCCESS,
+            user_id="user1",
+            portal_id="portal1"
+        )
+        
+        window = {
+            'start_date': datetime.utcnow() - timedelta(days=1),
+            'end_date': datetime.utcnow() + timedelta(days=1)
+        }
+        logs = logger.query_logs(**window, user_id="user1")
+        assert [entry['event_type'] for entry in logs] == ['data_access', 'auth_success']
+        
+        logs = logger.query_logs(**window, event_type=AuditEventType.DATA_ACCESS)
+        assert len(logs) == 3
+        
+        logs = logger.query_logs(**window, user_id='us\u00e9r')
+        assert len(logs) == 1
+
+
 class TestSessionManager:
     """Test session management functionality"""
     
@@ -366,6 +530,55 @@ class TestSessionManager:
             assert session_id not in session_manager.sessions
 
 
+    def test_cleanup_skips_refreshed_and_removes_revoked(self, session_manager):
+        """Test cleanup removes revoked sessions and keeps refreshed ones"""
+        session_manager.session_timeout_minutes = 0
+        refreshed_id = session_manager.create_session(
+            user_id="user1",
+            portal_id="test_portal",
+            auth_data={}
+        )
+        session_manager.session_timeout_minutes = 30
+        session_manager.sessions[refreshed_id]['expires_at'] = datetime.utcnow() + timedelta(minutes=1)
+        assert session_manager.refresh_session(refreshed_id) is True
+        
+        revoked_id = session_manager.create_session(
+            user_id="user2",
+            portal_id="test_portal",
+            auth_data={}
+        )
+        session_manager.revoke_session(revoked_id)
+        
+        assert session_manager.cleanup_expired_sessions() == 1
+        assert refreshed_id in session_manager.sessions
+        assert revoked_id not in session_manager.sessions
+
+    def test_cleanup_sees_sessions_changed_in_place(self, session_manager):
+        """Test cleanup honours expiry and status edited on the session dict"""
+        expired_id = session_manager.create_session(
+            user_id="user1",
+            portal_id="test_portal",
+            auth_data={}
+        )
+        revoked_id = session_manager.create_session(
+            user_id="user2",
+            portal_id="test_portal",
+            auth_data={}
+        )
+        active_id = session_manager.create_session(
+            user_id="user3",
+            portal_id="test_portal",
+            auth_data={}
+        )
+        session_manager.sessions[expired_id]['expires_at'] -= timedelta(hours=1)
+        session_manager.sessions[revoked_id]['status'] = SessionStatus.REVOKED.value
+
+        assert session_manager.cleanup_expired_sessions() == 2
+        assert expired_id not in session_manager.sessions
+        assert revoked_id not in session_manager.sessions
+        assert active_id in session_manager.sessions
+
+
 class TestOAuth2Client:
     """Test OAuth 2.0 client functionality"""
     
@@ -455,6 +668,27 @@ class TestOAuth2TokenManager:
         """Test retrieving non-existent client"""
         client = token_manager.get_client("nonexistent_portal")
         assert client is None
+    
+    async def test_refresh_all_skips_clients_without_refresh_token(self, token_manager, monkeypatch):
+        """Test bulk refresh only refreshes clients holding a refresh token"""
+        client_config = {
+            'client_id': 'test_client',
+            'client_secret': 'test_secret',
+            'authorization_endpoint': 'https://auth.example.com/authorize',
+            'token_endpoint': 'https://auth.example.com/token',
+            'redirect_uri': 'https://app.example.com/callback'
+        }
+        with_token = token_manager.register_client("portal_a", client_config)
+        token_manager.register_client("portal_b", client_config)
+        with_token.refresh_token = "refresh_a"
+        
+        async def fake_refresh(client):
+            return {'success': True, 'access_token': f"new_{client.refresh_token}"}
+        monkeypatch.setattr(OAuth2Client, "refresh_access_token", fake_refresh)
+        
+        results = await token_manager.refresh_all()
+        
+        assert results == {"portal_a": {'success': True, 'access_token': 'new_refresh_a'}}
 
 
 if __name__ == "__main__":
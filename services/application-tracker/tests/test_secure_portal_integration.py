@@ -81,6 +81,11 @@ class TestSecurePortalIntegration:
         assert session is not None
         assert session['user_id'] == 'test_user'
         assert session['portal_id'] == PortalType.MY_SCHEME.value
+        
+        # Timestamps are part of the returned session and stay datetimes
+        for key in ('created_at', 'last_activity', 'expires_at'):
+            assert isinstance(session[key], datetime)
+        assert session['expires_at'] > session['created_at']
     
     @pytest.mark.asyncio
     async def test_session_refresh(self, portal_integration):